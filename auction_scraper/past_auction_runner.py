@@ -1,4 +1,4 @@
-import subprocess
+import importlib
 import sys
 import time
 import os
@@ -10,13 +10,17 @@ from datetime import datetime
 # Set to a county name (e.g. "Clay") to only run that county, or None for all
 OVERRIDE_COUNTY = None
 
-# Define the scripts to run in order
+# Define the scraper modules to run in order (each exposes run())
 SCRIPTS = {
-    "Step 1 (Auctions)": "scrapers/past_tax_sale_scrape.py",
-    "Step 2 (Parcel History)": "scrapers/parcel_history_scrape.py",
-    "Step 3 (Verify)": "scrapers/verify_sale_flip_scrape_alignment.py"
+    "Step 1 (Auctions)": "past_tax_sale_scrape",
+    "Step 2 (Parcel History)": "parcel_history_scrape",
+    "Step 3 (Verify)": "verify_sale_flip_scrape_alignment"
 }
 
+# The steps run in-process, so their modules are imported from here
+SCRAPERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrapers')
+sys.path.insert(0, SCRAPERS_DIR)
+
 # Generate timestamp for output files (down to the second)
 RUN_TIMESTAMP = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
 
@@ -26,52 +30,44 @@ os.makedirs(LOG_DIR, exist_ok=True)
 RUNNER_LOG = os.path.join(LOG_DIR, f"pipeline_runner_{RUN_TIMESTAMP}.log")
 
 # --- LOGGING SETUP ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - [RUNNER] - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(RUNNER_LOG, mode='w', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# The runner gets its own handlers instead of configuring the root logger, so
+# the in-process scrapers' own logging.basicConfig (and log files) still apply
+logger = logging.getLogger("past_auction_runner")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_formatter = logging.Formatter('%(asctime)s - [RUNNER] - %(levelname)s - %(message)s')
+for _handler in (logging.FileHandler(RUNNER_LOG, mode='w', encoding='utf-8'), logging.StreamHandler()):
+    _handler.setFormatter(_formatter)
+    logger.addHandler(_handler)
 
 # --- EXECUTION ENGINE ---
 
-def run_script(step_name, script_path_relative):
+def run_script(step_name, module_name):
     """
-    Runs a python script as a subprocess and waits for it to finish.
+    Imports a scraper module and runs its run() entry point in this process.
+    Modules are imported only when their step starts, since they resolve
+    their input files (e.g. the latest tax_sales CSV) at import time.
     """
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    script_path = os.path.join(base_dir, script_path_relative)
-
-    if not os.path.exists(script_path):
-        logger.error(f"CRITICAL: Could not find script for {step_name} at: {script_path}")
-        return False
-
-    logger.info(f"--- STARTING {step_name}: {script_path_relative} ---")
+    logger.info(f"--- STARTING {step_name}: {module_name} ---")
     start_time = time.time()
 
     try:
-        # Run the script using the same Python interpreter executing this runner
-        env = os.environ.copy()
+        # The scrapers read this at import time
         if OVERRIDE_COUNTY:
-            env["OVERRIDE_COUNTY"] = OVERRIDE_COUNTY
-
-        result = subprocess.run(
-            [sys.executable, script_path],
-            check=True,  # Raises CalledProcessError if script fails
-            text=True,
-            capture_output=False, # Stream output directly to console
-            env=env
-        )
+            os.environ["OVERRIDE_COUNTY"] = OVERRIDE_COUNTY
+
+        module = importlib.import_module(module_name)
+        module.run()
         
         elapsed = time.time() - start_time
         logger.info(f"--- FINISHED {step_name} in {elapsed:.2f}s ---")
         return True
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"!!! FAILED {step_name} (Exit Code: {e.returncode}) !!!")
+    except ImportError as e:
+        logger.error(f"CRITICAL: Could not import {module_name} for {step_name}: {e}")
+        return False
+    except SystemExit as e:
+        logger.error(f"!!! FAILED {step_name} (Exit Code: {e.code}) !!!")
         return False
     except Exception as e:
         logger.error(f"!!! ERROR executing {step_name}: {e} !!!")
@@ -86,16 +82,11 @@ def main():
         logger.error("Pipeline aborted due to failure in Step 1.")
         sys.exit(1)
 
-    # Short cool-down to ensure file handles are closed and browser is dead
-    time.sleep(2)
-
     # 2. Run Step 2: History Scraper
     if not run_script("Step 2 (Parcel History)", SCRIPTS["Step 2 (Parcel History)"]):
         logger.error("Pipeline aborted due to failure in Step 2.")
         sys.exit(1)
 
-    time.sleep(1)
-
     # 3. Run Step 3: Verifier
     if not run_script("Step 3 (Verify)", SCRIPTS["Step 3 (Verify)"]):
         logger.error("Pipeline completed with errors in verification.")
@@ -5,7 +5,10 @@ import csv
 import os
 import sys
 import glob
-from lxml import html
+import json
+import re
+import functools
+import time
 from datetime import datetime
 
 # --- 1. GLOBAL CONFIGURATION ---
@@ -26,6 +29,21 @@ except ImportError:
 PROXY_FILE = os.path.join(PROJECT_ROOT, "proxies.txt")
 # -------------------
 
+# Persistent HTTP cache so county portal JS/CSS isn't refetched every launch
+try:
+    from browser_config import disk_cache_args
+    CACHE_ARGS = disk_cache_args("parcel_history")
+except ImportError:
+    CACHE_ARGS = []
+
+# Optional: pyarrow parses large input CSVs natively; csv module otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 # Find the most recent tax_sales CSV file
 AUCTION_DIR = os.path.dirname(SCRIPT_DIR)
 PAST_AUCTIONS_DIR = os.path.join(AUCTION_DIR, "past_auctions")
@@ -99,7 +117,10 @@ COUNTY_CONFIGS = {
     },
     "Nassau": {
         "output_file": os.path.join(AUCTION_DIR, "parcel_history", f"nassau_assessment_and_flips_{RUN_TIMESTAMP}.csv"),
-        "wait_target": "SALES INFORMATION",
+        "wait_target": "//*[contains(text(),'SALES INFORMATION')]",
+        # The values table renders after the sales header; wait for it before extracting
+        "ready_target": '//table//tr[td[contains(text(),"Land Value")]]/td[2]',
+        "page_concurrency": 8,
         "xp_val_bldg": '//table//tr[td[contains(text(),"Improved Value")]]/td[2]',
         "xp_val_land": '//table//tr[td[contains(text(),"Land Value")]]/td[2]',
         "xp_rows": '//div[contains(.,"SALES INFORMATION")]/following-sibling::*//tr[position()>1]',
@@ -113,50 +134,274 @@ COUNTY_CONFIGS = {
 
 # --- 2. HELPERS ---
 
+class ElementMissingError(Exception):
+    """Raised when an expected element never appears on the page."""
+    pass
+
+class FailurePhraseError(Exception):
+    """Raised when the page shows a county failure indicator (rate limit, error page)."""
+    pass
+
+def retry_backoff(attempt):
+    """Exponential backoff with jitter: 0.25s, 0.5s, 1s, ... capped at 8s."""
+    return min(8, 0.25 * 2 ** attempt) + random.random() * 0.25
+
+class RateLimiter:
+    """
+    Token bucket shared by all of a county's tabs: allows `rate` page loads
+    per second on average, with bursts of up to `burst`. Waiters are served
+    in arrival order.
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._updated = time.monotonic()
+                self._tokens = 1
+            self._tokens -= 1
+
+LONG_DATE_FORMAT = "%A %B %d, %Y"
+
+# Date strings repeat heavily across sales tables (same deed dates),
+# so the pure converters below are memoized.
+PARSE_CACHE_SIZE = 8192
+
+def split_numeric_date(clean_str):
+    """
+    (sep, (a, b, c)) for a numeric date shaped like the strptime formats the
+    counties use: a 4-digit year (first with '-', last with '/') and 1-2 digit
+    month/day. None for anything else, e.g. two-digit years.
+    """
+    sep = '-' if '-' in clean_str else '/'
+    parts = clean_str.split(sep)
+    if len(parts) != 3 or not all(p.isdecimal() for p in parts):
+        return None
+    year_idx = 0 if sep == '-' else 2
+    if any(len(p) != 4 if i == year_idx else len(p) > 2 for i, p in enumerate(parts)):
+        return None
+    return sep, tuple(int(p) for p in parts)
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_date(date_str):
+    """
+    Parse the county date formats. Numeric dates (YYYY-MM-DD, MM/DD/YYYY,
+    then DD/MM/YYYY) are split by hand; only the long weekday form goes
+    through strptime.
+    """
     if not date_str: return datetime.min
     clean_str = date_str.strip()
-    formats = ["%A %B %d, %Y", "%m/%d/%Y", "%Y-%m-%d", "%d/%m/%Y"]
-    for fmt in formats:
-        parsed = None
-        try: 
-            parsed = datetime.strptime(clean_str, fmt)
-        except ValueError: 
-            continue
-        if parsed:
-            return parsed
-    return datetime.min
+    if ',' in clean_str:
+        try:
+            return datetime.strptime(clean_str, LONG_DATE_FORMAT)
+        except ValueError:
+            return datetime.min
+
+    split = split_numeric_date(clean_str)
+    if split is None:
+        return datetime.min
+    sep, (a, b, c) = split
+    try:
+        if sep == '-':
+            return datetime(a, b, c)
+        try:
+            return datetime(c, a, b)
+        except ValueError:
+            return datetime(c, b, a)
+    except ValueError:
+        return datetime.min
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def to_ymd(date_str):
+    """
+    Date string -> int YYYYMMDD for cheap comparisons; 0 if unparseable.
+    Splits the dominant MM/DD/YYYY and Nassau's YYYY-MM-DD formats directly
+    and falls back to parse_date (DD/MM/YYYY, long dates, invalid days).
+    """
+    if not date_str: return 0
+    clean_str = date_str.strip()
+    split = split_numeric_date(clean_str)
+    if split is not None:
+        sep, (a, b, c) = split
+        y, m, d = (a, b, c) if sep == '-' else (c, a, b)
+        try:
+            datetime(y, m, d)
+            return y * 10000 + m * 100 + d
+        except ValueError:
+            pass
+    parsed = parse_date(date_str)
+    if parsed == datetime.min: return 0
+    return parsed.year * 10000 + parsed.month * 100 + parsed.day
+
+# Runs every county XPath inside the browser and ships back only the text we
+# need, instead of pulling the whole serialized DOM over CDP and reparsing it.
+# Sales-row columns are read by index from each row's own cells (collected
+# once per row); any column that isn't a plain ./td[N] or ./th[N] falls back
+# to an XPath compiled once with createExpression. Each column is turned into
+# a getter before the row loop starts.
+EXTRACT_JS = """
+(() => {
+    const cfg = %s;
+    const clean = (node) => node ? node.textContent.trim() : "N/A";
+    const compile = (xp) => document.createExpression(xp, null);
+    const first = (expr, ctx) => expr.evaluate(ctx, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    // One getter per column, specialized up front so the row loop never re-inspects the spec
+    const getters = cfg.cols.map(c => {
+        if (Array.isArray(c)) {
+            const [tag, idx] = c;
+            return (cells) => cells[tag][idx];
+        }
+        const expr = compile(c);
+        return (cells, row) => first(expr, row);
+    });
+    const snap = compile(cfg.xp_rows).evaluate(document, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const rows = [];
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        const row = snap.snapshotItem(i);
+        const cells = {td: [], th: []};
+        for (const child of row.children) {
+            const tag = child.tagName.toLowerCase();
+            if (tag in cells) cells[tag].push(child);
+        }
+        rows.push(getters.map(get => clean(get(cells, row))));
+    }
+    return JSON.stringify({
+        bldg: clean(first(compile(cfg.xp_val_bldg), document)),
+        land: clean(first(compile(cfg.xp_val_land), document)),
+        rows: rows,
+    });
+})()
+"""
+
+# Sales-row columns, in the order parse_property unpacks them
+ROW_COLUMN_KEYS = ("xp_date", "xp_price", "xp_deed", "xp_qual", "xp_vacant")
+CELL_XPATH_RE = re.compile(r"^\./(td|th)\[(\d+)\]$")
+
+def column_spec(xpath):
+    """Turn './td[N]' / './th[N]' into a [tag, index] cell lookup; leave other XPaths as-is."""
+    match = CELL_XPATH_RE.match(xpath)
+    return [match.group(1), int(match.group(2)) - 1] if match else xpath
+
+def build_extract_js(config):
+    return EXTRACT_JS % json.dumps({
+        "xp_rows": config["xp_rows"],
+        "xp_val_bldg": config["xp_val_bldg"],
+        "xp_val_land": config["xp_val_land"],
+        "cols": [column_spec(config[k]) for k in ROW_COLUMN_KEYS],
+    })
+
+# Checks the page text for banned/failure phrases in-browser and returns only
+# the first match of each, so the full HTML never has to cross the CDP socket.
+PHRASE_CHECK_JS = """
+(() => {
+    const text = document.documentElement ? document.documentElement.textContent.toLowerCase() : "";
+    const first = (phrases) => phrases.find(p => text.includes(p.toLowerCase())) || null;
+    return JSON.stringify({banned: first(%s), failure: first(%s)});
+})()
+"""
+
+def build_phrase_check_js(config):
+    """Return the county's phrase-check script, or None if it has no phrases to check."""
+    banned = config.get("banned_phrases", [])
+    failure = config.get("failure_phrases", [])
+    if not banned and not failure:
+        return None
+    return PHRASE_CHECK_JS % (json.dumps(banned), json.dumps(failure))
 
-def clean_price(price_str):
-    if not price_str: return "0"
-    return price_str.replace('$', '').replace(',', '').strip()
+# Build each county's extraction and phrase-check scripts once at import instead of per task
+for _config in COUNTY_CONFIGS.values():
+    _config['extract_js'] = build_extract_js(_config)
+    _config['phrase_check_js'] = build_phrase_check_js(_config)
 
-async def safe_get_text(tree, xpath):
-    nodes = tree.xpath(xpath)
-    return nodes[0].text_content().strip() if nodes else "N/A"
+async def extract_property_data(page, config):
+    """
+    Evaluate the county's XPaths in one CDP round trip.
+    Returns {"bldg": str, "land": str, "rows": [[date, price, deed, qual, vacant], ...]}.
+    """
+    raw = await page.evaluate(config['extract_js'])
+    return json.loads(raw)
+
+# Resources the scraper never reads; blocking them cuts page weight on GIS-heavy portals
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*/tile/*",
+]
+
+async def block_heavy_resources(tab):
+    """Tell Chrome not to fetch images, fonts, media, or map tiles for this tab."""
+    # Built outside the try so a wrong CDP helper name fails loudly
+    # (nodriver's generated name for Network.setBlockedURLs is set_blocked_ur_ls)
+    block_command = n.cdp.network.set_blocked_ur_ls(urls=BLOCKED_URL_PATTERNS)
+    try:
+        await tab.send(n.cdp.network.enable())
+        await tab.send(block_command)
+    except Exception as e:
+        print(f"  [WARNING] Could not enable resource blocking: {e}")
 
-async def wait_for_xpath(page, xpath, attempts, pause_length):
-    elem = []
-    for _ in range(attempts):
+async def disable_unused_domains(tab):
+    """
+    Turn off CDP domains whose events we never read, so the websocket loop
+    isn't decoding a stream of console/metrics messages during long scrapes.
+    Network stays on: the URL blocking set by block_heavy_resources
+    (Network.setBlockedURLs) only applies while that domain is enabled.
+    """
+    for command in (n.cdp.log.disable(), n.cdp.performance.disable()):
         try:
-            elem = await page.xpath(xpath)
-            if elem:
-                return
-            await asyncio.sleep(pause_length)
-        except:
+            await tab.send(command)
+        except Exception:
             pass
-    raise Exception("Element not found")        
 
+async def prepare_tab(tab):
+    """Apply resource blocking and CDP domain trimming to a freshly opened tab."""
+    await block_heavy_resources(tab)
+    await disable_unused_domains(tab)
 
-async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, search_page=None):
+XPATH_EXISTS_JS = "!!document.evaluate(%s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+DOCUMENT_READY_JS = "document.readyState !== 'loading'"
+
+async def wait_until(page, expression, timeout, poll_interval=0.05):
+    """Poll a boolean in-page expression; returns True once it holds, False on timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            if await page.evaluate(expression):
+                return True
+        except Exception:
+            pass
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(poll_interval)
+
+async def wait_for_xpath(page, xpath, timeout=10, poll_interval=0.05):
+    """
+    Wait until xpath matches a node, checking in-page every poll_interval seconds.
+    Returns as soon as the element exists instead of sleeping a fixed second per check.
+    """
+    if not await wait_until(page, XPATH_EXISTS_JS % json.dumps(xpath), timeout, poll_interval):
+        raise ElementMissingError(f"Element not found: {xpath}")
+
+
+async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, search_page=None, tab=None, limiter=None):
     """
     Navigate to a parcel page. Returns (page, agree_clicked, needs_manual_review, search_page).
     If needs_manual_review is True, the page contains banned phrases and should be skipped.
     For search-based counties (Clay), reuses the search page instead of reloading it each time.
+    For direct-URL counties, navigates the given tab (if any) so concurrent callers don't share a page,
+    taking a token from the limiter (if any) before every page load, retries included.
     """
     max_retries = 10
-    banned_phrases = config.get("banned_phrases", [])
-    failure_phrases = config.get("failure_phrases", [])
+    phrase_check_js = config.get("phrase_check_js")
+    failures = {}
 
     for attempt in range(max_retries):
         try:
@@ -168,7 +413,7 @@ async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, sea
 
                     # Handle 'Agree' button - only if not already clicked
                     if 'click_agree' in config and not agree_clicked:
-                        await wait_for_xpath(search_page, config['click_agree'], 10, 1)
+                        await wait_for_xpath(search_page, config['click_agree'])
                         btn = await search_page.xpath(config['click_agree'])
                         await btn[0].click()
                         agree_clicked = True
@@ -180,7 +425,7 @@ async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, sea
                     await asyncio.sleep(random.uniform(1.5, 3))
 
                 # Find Input & Type PID
-                await wait_for_xpath(search_page, config['search_input_xpath'], 10, 1)
+                await wait_for_xpath(search_page, config['search_input_xpath'])
                 await asyncio.sleep(random.uniform(0.5, 1.5))
                 input_el = await search_page.xpath(config['search_input_xpath'])
                 if input_el:
@@ -188,7 +433,7 @@ async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, sea
                     await asyncio.sleep(random.uniform(0.3, 0.8))
                     await input_el[0].send_keys(pid)
 
-                    await wait_for_xpath(search_page, config["search_btn"], 10, 1)
+                    await wait_for_xpath(search_page, config["search_btn"])
                     await asyncio.sleep(random.uniform(0.5, 1.5))
                     search_btn = await search_page.xpath(config["search_btn"])
                     await search_btn[0].scroll_into_view()
@@ -201,41 +446,46 @@ async def get_to_parcel_page(config, browser, pid, url, agree_clicked=False, sea
                 page = search_page
             else:
                 # >>> STANDARD WORKFLOW (Direct URL) >>>
-                page = await browser.get(url)
-                await asyncio.sleep(1)
+                if limiter:
+                    await limiter.acquire()
+                page = await tab.get(url) if tab else await browser.get(url)
+                # Settle until the DOM is parsed (capped at the old fixed 1s) before the phrase check
+                await wait_until(page, DOCUMENT_READY_JS, timeout=1)
 
             # --- COMMON WAIT & PARSE ---
-            
+
+            # Check phrases in-page; only the matched phrase (if any) comes back
+            found = json.loads(await page.evaluate(phrase_check_js)) if phrase_check_js else {}
+
             # 3. Check for banned phrases - if found, mark for manual review (no retry)
-            if banned_phrases:
-                page_content = await page.get_content()
-                for phrase in banned_phrases:
-                    if phrase.lower() in page_content.lower():
-                        print(f"  -> BANNED PHRASE DETECTED: '{phrase}' - marking for manual review")
-                        return page, agree_clicked, True  # needs_manual_review = True
-                    
+            if found.get("banned"):
+                print(f"  -> BANNED PHRASE DETECTED: '{found['banned']}' - marking for manual review")
+                return page, agree_clicked, True, search_page  # needs_manual_review = True
+
             # 3. Check for failure indicator phrases - if found, raise error and retry
-            if failure_phrases:
-                page_content = await page.get_content()
-                for phrase in failure_phrases:
-                    if phrase.lower() in page_content.lower():
-                        print(f"  -> FAILURE PHRASE DETECTED: '{phrase}' - retrying")
-                        raise   Exception("Found a failure indicator")
-
-            # 4. Wait for Property Page Load
-            await wait_for_xpath(page, config['wait_target'], 10, 1)
-            await asyncio.sleep(1.5)
+            if found.get("failure"):
+                print(f"  -> FAILURE PHRASE DETECTED: '{found['failure']}' - retrying")
+                raise FailurePhraseError(f"Found a failure indicator: {found['failure']}")
+
+            # 4. Wait for Property Page Load (and any late-rendering content the extract needs)
+            await wait_for_xpath(page, config['wait_target'])
+            if 'ready_target' in config:
+                # Soft wait: some parcels have no such row, and parse_property reports what's missing
+                await wait_until(page, XPATH_EXISTS_JS % json.dumps(config['ready_target']), 5)
             
             return page, agree_clicked, False, search_page
 
         except Exception as e:
+            kind = type(e).__name__
+            failures[kind] = failures.get(kind, 0) + 1
             if attempt < max_retries - 1:
-                print(f"  -> Failed to load property page (attempt {attempt + 1}/{max_retries}), retrying...")
-                await asyncio.sleep(1)
+                delay = retry_backoff(attempt)
+                print(f"  -> Failed to load property page (attempt {attempt + 1}/{max_retries}, {kind}: {e}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
                 search_page = None  # Force full reload on retry
                 continue
             # All retries exhausted - mark for manual review instead of crashing
-            print(f"  -> FAILED after {max_retries} attempts - marking for manual review")
+            print(f"  -> FAILED after {max_retries} attempts {failures} - marking for manual review")
             return None, agree_clicked, True, None
 
     # Should not reach here, but just in case
@@ -266,68 +516,209 @@ async def force_active_session(page):
     
 # --- 3. CORE LOGIC ---
 
-async def parse_property(page_html, url, date_str, price_str, pid, config):
-    tree = html.fromstring(page_html)
+async def parse_property(page, url, date_str, price_str, pid, config):
+    """Returns (rows to write, number of flips found); a no-flip parcel gets one N/A row."""
+    data = await extract_property_data(page, config)
     found_rows = []
 
-    # A. Parse Input
-    target_date = parse_date(date_str)
-    target_price_clean = clean_price(price_str)
+    # A. Parse Input (dates as YYYYMMDD ints)
+    target_date = to_ymd(date_str)
 
     # B. Extract Assessment Values
-    bldg_val = await safe_get_text(tree, config['xp_val_bldg'])
-    land_val = await safe_get_text(tree, config['xp_val_land'])
+    bldg_val = data["bldg"]
+    land_val = data["land"]
 
     # C. Iterate History
-    sales_rows = tree.xpath(config['xp_rows'])
-    
-    has_flips = False
-    if sales_rows:
-        for row in sales_rows:
-            def get_col(rel_xpath):
-                nodes = row.xpath(rel_xpath)
-                return nodes[0].text_content().strip() if nodes else "N/A"
-
-            h_date_str = get_col(config['xp_date'])
-            h_price_str = get_col(config['xp_price'])
-            
-            h_date = parse_date(h_date_str)
-            h_price_clean = clean_price(h_price_str)
+    for h_date_str, h_price_str, hist_deed, hist_qual, hist_vacant in data["rows"]:
+        # Only sales newer than the tax deed count as flips; this also skips
+        # the tax deed sale itself, so no price comparison is needed
+        if to_ymd(h_date_str) <= target_date:
+            continue
 
-            # Skip the tax deed sale itself
-            if h_date == target_date and h_price_clean == target_price_clean:
-                continue
+        # Skip if this is a Tax Deed (sometimes registered after actual sale)
+        if "tax deed" in hist_deed.lower() or "TD" in hist_deed.upper():
+            continue
 
-            # Check for Flip (Newer than Tax Deed)
-            if h_date > target_date:
-                hist_deed = get_col(config['xp_deed'])
-                
-                # Skip if this is a Tax Deed (sometimes registered after actual sale)
-                if "tax deed" in hist_deed.lower() or "TD" in hist_deed.upper():
-                    continue
-                
-                has_flips = True
-                found_rows.append([
-                    url, pid, date_str, price_str, bldg_val, land_val,
-                    h_date_str, h_price_str,
-                    hist_deed,
-                    get_col(config['xp_qual']),
-                    get_col(config['xp_vacant'])
-                ])
+        found_rows.append([
+            url, pid, date_str, price_str, bldg_val, land_val,
+            h_date_str, h_price_str,
+            hist_deed,
+            hist_qual,
+            hist_vacant
+        ])
 
     # D. Fallback (No flips found)
-    if not has_flips:
+    flips_count = len(found_rows)
+    if not flips_count:
         found_rows.append([
             url, pid, date_str, price_str, bldg_val, land_val,
             "N/A", "N/A", "N/A", "N/A", "N/A"
         ])
 
-    return found_rows
+    return found_rows, flips_count
+
+MANUAL_REVIEW_ROW = ["MANUAL REVIEW"] * 7
+
+
+def write_rows(writer, f, rows, pending):
+    """
+    Write rows and flush only once FLUSH_EVERY rows have accumulated.
+    Returns the updated count of unflushed rows.
+    """
+    writer.writerows(rows)
+    pending += len(rows)
+    if pending >= FLUSH_EVERY:
+        f.flush()
+        return 0
+    return pending
+
+
+async def scrape_one(browser, config, task, tab_pool, queue, limiter):
+    """
+    Scrape a single direct-URL property on a tab checked out from the pool.
+    Page loads are paced by the county-wide limiter rather than per-tab sleeps.
+    Rows are pushed onto the queue so the single writer coroutine owns the CSV.
+    """
+    url, date, price, pid = task
+    tab = await tab_pool.get()
+    try:
+        try:
+            page, _, needs_manual_review, _ = await get_to_parcel_page(config, browser, pid, url, tab=tab, limiter=limiter)
+
+            if needs_manual_review:
+                await queue.put([[url, pid, date, price] + MANUAL_REVIEW_ROW])
+                return
+
+            results, flips_count = await parse_property(page, url, date, price, pid, config)
+        except Exception as e:
+            print(f"  [{pid}] -> Error scraping property: {e} - marking for manual review")
+            await queue.put([[url, pid, date, price] + MANUAL_REVIEW_ROW])
+            return
+
+        if flips_count:
+            print(f"  [{pid}] -> FOUND {flips_count} NEW SALE(S)!")
+        else:
+            print(f"  [{pid}] -> No new sales.")
+
+        await queue.put(results)
+    finally:
+        # FIFO return keeps the pool least-recently-used first
+        tab_pool.put_nowait(tab)
+
+
+async def csv_writer_worker(queue, writer, f):
+    """Drain row batches from the queue into the CSV until a None sentinel arrives."""
+    pending = 0
+    while True:
+        rows = await queue.get()
+        if rows is None:
+            break
+        pending = write_rows(writer, f, rows, pending)
+    f.flush()
+
+
+async def open_tab_pool(browser, size):
+    """Open `size` prepared blank tabs and return them in a FIFO queue."""
+    tab_pool = asyncio.Queue()
+    for _ in range(size):
+        tab = await browser.get("about:blank", new_tab=True)
+        await prepare_tab(tab)
+        tab_pool.put_nowait(tab)
+    return tab_pool
+
+
+async def close_tab_pool(tab_pool):
+    while not tab_pool.empty():
+        try:
+            await tab_pool.get_nowait().close()
+        except Exception:
+            pass
+
+
+async def process_direct_batch(browser, config, tasks, writer, f):
+    """
+    Scrape direct-URL counties across a pool of tabs (the county's
+    page_concurrency, else PAGE_CONCURRENCY) that is created once per county
+    and reused for every property.
+    """
+    size = config.get("page_concurrency", PAGE_CONCURRENCY)
+    tab_pool = await open_tab_pool(browser, min(size, len(tasks)))
+    limiter = RateLimiter(config.get("page_loads_per_second", PAGE_LOADS_PER_SECOND), burst=PAGE_LOAD_BURST)
+    queue = asyncio.Queue()
+    writer_task = asyncio.create_task(csv_writer_worker(queue, writer, f))
+
+    try:
+        await asyncio.gather(*[scrape_one(browser, config, t, tab_pool, queue, limiter) for t in tasks])
+    finally:
+        await queue.put(None)
+        await writer_task
+        await close_tab_pool(tab_pool)
+
+
+async def process_search_batch(browser, county_name, config, tasks, writer, f):
+    """
+    Scrape search-based counties (Clay) one property at a time, since the
+    search page is shared state. Rotates proxy every CLAY_PROXY_ROTATE_EVERY
+    properties. Returns the (possibly new) browser instance.
+    """
+    agree_clicked = False
+    search_page = None
+    since_rotate = 0
+    pending = 0
+
+    # Verify proxy on first launch for Clay
+    if county_name == "Clay":
+        ip = await verify_proxy(browser)
+        if ip:
+            print(f"  [PROXY] Starting Clay with external IP: {ip}")
+        else:
+            print(f"  [WARNING] Could not verify proxy — proceeding anyway")
+
+    for i, (url, date, price, pid) in enumerate(tasks):
+        # Rotate proxy for Clay every N properties
+        if county_name == "Clay" and since_rotate >= CLAY_PROXY_ROTATE_EVERY:
+            print(f"\n  >> Rotating proxy (after {since_rotate} properties)...")
+            browser.stop()
+            await asyncio.sleep(2)
+            browser = await launch_browser()
+            agree_clicked = False
+            search_page = None
+            since_rotate = 0
+
+            # Verify the new proxy is actually working
+            new_ip = await verify_proxy(browser)
+            if new_ip:
+                print(f"  [PROXY] New external IP: {new_ip}")
+            else:
+                print(f"  [WARNING] Proxy verification failed — proceeding anyway")
+
+        page, agree_clicked, needs_manual_review, search_page = await get_to_parcel_page(config, browser, pid, url, agree_clicked, search_page)
+
+        if needs_manual_review:
+            pending = write_rows(writer, f, [[url, pid, date, price] + MANUAL_REVIEW_ROW], pending)
+            await asyncio.sleep(1)
+            continue
+
+        results, flips_count = await parse_property(page, url, date, price, pid, config)
+
+        if flips_count:
+            print(f"  -> FOUND {flips_count} NEW SALE(S)!")
+        else:
+            print("  -> No new sales.")
+
+        pending = write_rows(writer, f, results, pending)
+        since_rotate += 1
+
+        await asyncio.sleep(random.uniform(3, 7))
+
+    return browser
+
 
 async def process_county_batch(browser, county_name, tasks):
     """
-    Process all properties for a county. For Clay, rotates proxy every
-    CLAY_PROXY_ROTATE_EVERY properties to avoid rate-limiting.
+    Process all properties for a county. Direct-URL counties are scraped
+    concurrently across a pool of tabs; search-based counties (Clay) run
+    serially with proxy rotation.
     Returns the (possibly new) browser instance.
     """
     config = COUNTY_CONFIGS.get(county_name)
@@ -335,14 +726,10 @@ async def process_county_batch(browser, county_name, tasks):
         print(f"Skipping unknown county: {county_name}")
         return browser
 
-    agree_clicked = False
-    search_page = None
-    since_rotate = 0
-
     output_file = config['output_file']
     print(f"\n--- Starting {county_name} ({len(tasks)} properties) -> {output_file} ---")
 
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
         writer = csv.writer(f)
         writer.writerow([
             "URL", "Parcel ID", "Tax Deed Date", "Tax Deed Price",
@@ -350,61 +737,10 @@ async def process_county_batch(browser, county_name, tasks):
             "FLIP Date", "FLIP Price", "Instrument", "Qualified", "Vacant/Imp"
         ])
 
-        # Verify proxy on first launch for Clay
-        if county_name == "Clay":
-            ip = await verify_proxy(browser)
-            if ip:
-                print(f"  [PROXY] Starting Clay with external IP: {ip}")
-            else:
-                print(f"  [WARNING] Could not verify proxy — proceeding anyway")
-
-        for i, (url, date, price, pid) in enumerate(tasks):
-            # Rotate proxy for Clay every N properties
-            if county_name == "Clay" and since_rotate >= CLAY_PROXY_ROTATE_EVERY:
-                print(f"\n  >> Rotating proxy (after {since_rotate} properties)...")
-                browser.stop()
-                await asyncio.sleep(2)
-                browser = await launch_browser()
-                agree_clicked = False
-                search_page = None
-                since_rotate = 0
-
-                # Verify the new proxy is actually working
-                new_ip = await verify_proxy(browser)
-                if new_ip:
-                    print(f"  [PROXY] New external IP: {new_ip}")
-                else:
-                    print(f"  [WARNING] Proxy verification failed — proceeding anyway")
-
-            page, agree_clicked, needs_manual_review, search_page = await get_to_parcel_page(config, browser, pid, url, agree_clicked, search_page)
-
-            if needs_manual_review:
-                writer.writerow([
-                    url, pid, date, price,
-                    "MANUAL REVIEW", "MANUAL REVIEW",
-                    "MANUAL REVIEW", "MANUAL REVIEW", "MANUAL REVIEW", "MANUAL REVIEW", "MANUAL REVIEW"
-                ])
-                f.flush()
-                await asyncio.sleep(1)
-                continue
-
-            content = await page.get_content()
-            results = await parse_property(content, url, date, price, pid, config)
-
-            flips_count = sum(1 for r in results if r[6] != "N/A")
-            if flips_count:
-                print(f"  -> FOUND {flips_count} NEW SALE(S)!")
-            else:
-                print("  -> No new sales.")
-
-            writer.writerows(results)
-            f.flush()
-            since_rotate += 1
-
-            if county_name == "Clay":
-                await asyncio.sleep(random.uniform(3, 7))
-            else:
-                await asyncio.sleep(1)
+        if "search_url" in config:
+            browser = await process_search_batch(browser, county_name, config, tasks, writer, f)
+        else:
+            await process_direct_batch(browser, config, tasks, writer, f)
 
     return browser
 
@@ -413,6 +749,18 @@ async def process_county_batch(browser, county_name, tasks):
 # How many properties to process before rotating proxy (Clay only)
 CLAY_PROXY_ROTATE_EVERY = 5
 
+# How many CSV rows to buffer before flushing the output file
+FLUSH_EVERY = 32
+
+# How many tabs to scrape concurrently for direct-URL counties (Duval, Baker, Nassau);
+# a county config can override it with "page_concurrency"
+PAGE_CONCURRENCY = 4
+
+# County-wide page-load rate for direct-URL counties, shared by all tabs;
+# a county config can override it with "page_loads_per_second"
+PAGE_LOADS_PER_SECOND = 2
+PAGE_LOAD_BURST = 2
+
 try:
     from window_utils import get_chrome_window_args, move_chrome_to_vscode_monitor
 except ImportError:
@@ -422,7 +770,7 @@ except ImportError:
 
 async def launch_browser():
     """Launch a fresh browser with a random proxy and correct monitor position."""
-    browser_args = ['--start-maximized']
+    browser_args = ['--start-maximized'] + CACHE_ARGS
 
     if get_chrome_window_args:
         browser_args.extend(get_chrome_window_args())
@@ -431,12 +779,14 @@ async def launch_browser():
     if proxy_str:
         print(f"Using Proxy: {proxy_str}")
         ext_path = os.path.join(SCRIPT_DIR, "chrome_proxy_auth_ext")
-        if create_proxy_auth_extension(proxy_str, ext_path):
-            browser_args.append(f"--load-extension={ext_path}")
+        ext_dir = create_proxy_auth_extension(proxy_str, ext_path)
+        if ext_dir:
+            browser_args.append(f"--load-extension={ext_dir}")
     else:
         print("No proxy found (or proxies.txt is missing). Running with Direct Connection.")
 
     browser = await n.start(browser_args=browser_args)
+    await prepare_tab(browser.main_tab)
 
     if move_chrome_to_vscode_monitor:
         await asyncio.sleep(1)
@@ -457,53 +807,164 @@ async def verify_proxy(browser):
         return None
 
 
-async def main():
-    browser = await launch_browser()
+# Input CSV columns the scraper reads, in task order (County first)
+INPUT_COLUMNS = ("County", "Link", "Date", "Sale Amount", "Parcel ID")
 
-    county_tasks = {k: [] for k in COUNTY_CONFIGS.keys()}
+def read_input_rows_arrow(path, wanted):
+    """
+    Read the input CSV with pyarrow and filter to the wanted counties in one
+    vectorized pass. Returns (county, link, date, price, pid) tuples, or None
+    if the file has no County column or pyarrow can't parse it (ragged rows),
+    so the csv reader can take over.
+    """
+    try:
+        table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in INPUT_COLUMNS}))
+    except pa.ArrowInvalid:
+        return None
+    if "County" not in table.column_names:
+        return None
 
-    if TEST_OVERRIDE:
-        print(f"\n!!! USING SINGLE TASK OVERRIDE !!!")
-        ov_url, ov_date, ov_price, ov_pid, ov_county = TEST_OVERRIDE
-        if ov_county in county_tasks:
-            county_tasks[ov_county].append((ov_url, ov_date, ov_price, ov_pid))
-    
-    elif os.path.exists(INPUT_CSV):
-        if OVERRIDE_COUNTY:
-             print(f"\n!!! USING COUNTY OVERRIDE: {OVERRIDE_COUNTY} !!!")
-
-        with open(INPUT_CSV, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                c = row.get('County', '').strip()
-                c_key = c.capitalize() if c.capitalize() in COUNTY_CONFIGS else c
-                
-                if OVERRIDE_COUNTY and c_key != OVERRIDE_COUNTY:
+    counties = pc.utf8_capitalize(pc.utf8_trim_whitespace(table["County"]))
+    mask = pc.is_in(counties, value_set=pa.array(sorted(wanted), pa.string()))
+    table = table.filter(mask)
+
+    def column(name, default):
+        if name in table.column_names:
+            return table[name].to_pylist()
+        return [default] * table.num_rows
+
+    return list(zip(
+        counties.filter(mask).to_pylist(),
+        column("Link", None),
+        column("Date", None),
+        column("Sale Amount", None),
+        column("Parcel ID", "N/A"),
+    ))
+
+def read_input_rows_csv(path, wanted):
+    """
+    csv-module fallback for read_input_rows_arrow, skipping rows for counties
+    we aren't processing before touching any other column.
+    Returns None if the file has no County column.
+    """
+    rows = []
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        cols = {name: i for i, name in enumerate(header)}
+        county_i = cols.get('County')
+        if county_i is None:
+            print(f"Error: 'County' column missing in {path}. Found: {header}")
+            return None
+        link_i, date_i = cols.get('Link'), cols.get('Date')
+        price_i, pid_i = cols.get('Sale Amount'), cols.get('Parcel ID')
+        width = len(header)
+
+        for row in reader:
+            # DictReader skipped blank lines; keep doing so
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+
+            c_key = (row[county_i] or '').strip().capitalize()
+            if c_key not in wanted:
+                continue
+
+            rows.append((
+                c_key,
+                (row[link_i] or '') if link_i is not None else None,
+                (row[date_i] or '') if date_i is not None else None,
+                (row[price_i] or '') if price_i is not None else None,
+                (row[pid_i] or '') if pid_i is not None else 'N/A'
+            ))
+    return rows
+
+def read_input_tasks(path, county_tasks):
+    """Read the tax sales CSV into county_tasks for the counties we're processing."""
+    wanted = {OVERRIDE_COUNTY} if OVERRIDE_COUNTY else set(county_tasks)
+    wanted &= set(county_tasks)
+
+    rows = read_input_rows_arrow(path, wanted) if pa is not None else None
+    if rows is None:
+        rows = read_input_rows_csv(path, wanted)
+        if rows is None:
+            return
+
+    for c_key, url, date, price, pid in rows:
+        # For Clay, we accept "N/A" URLs because we search by PID
+        if "search_url" in COUNTY_CONFIGS[c_key] or (url and url != "N/A"):
+            county_tasks[c_key].append((url, date, price, pid))
+
+
+def dedupe_tasks(county_tasks):
+    """Drop repeat parcel IDs within each county so no property is scraped twice."""
+    for county, tasks in county_tasks.items():
+        seen = set()
+        unique = []
+        for task in tasks:
+            pid = (task[3] or "").strip()
+            if pid and pid != "N/A":
+                if pid in seen:
+                    print(f"[WARN] Duplicate parcel {pid} in {county} input - skipping repeat")
                     continue
+                seen.add(pid)
+            unique.append(task)
+        county_tasks[county] = unique
 
-                if c_key in county_tasks:
-                    url = row.get('Link')
-                    # For Clay, we accept "N/A" URLs because we search by PID
-                    if "search_url" in COUNTY_CONFIGS[c_key] or (url and url != "N/A"):
-                        county_tasks[c_key].append((
-                            url, 
-                            row.get('Date'), 
-                            row.get('Sale Amount'), 
-                            row.get('Parcel ID', 'N/A')
-                        ))
-    else:
-        print(f"Input file {INPUT_CSV} not found.")
-        return
 
-    # Execute batches - Clay first, then the rest
-    # (Clay uses a search workflow that requires active session management)
-    COUNTY_ORDER = ["Clay", "Duval", "Baker", "Nassau"]
-    
-    for county in COUNTY_ORDER:
-        if county in county_tasks and county_tasks[county]:
-            browser = await process_county_batch(browser, county, county_tasks[county])
+async def main():
+    # Start Chrome in the background so its boot overlaps with reading the input CSV
+    browser_task = asyncio.create_task(launch_browser())
 
-    # browser.stop()
+    browser = None
+    try:
+        county_tasks = {k: [] for k in COUNTY_CONFIGS.keys()}
+
+        if TEST_OVERRIDE:
+            print(f"\n!!! USING SINGLE TASK OVERRIDE !!!")
+            ov_url, ov_date, ov_price, ov_pid, ov_county = TEST_OVERRIDE
+            if ov_county in county_tasks:
+                county_tasks[ov_county].append((ov_url, ov_date, ov_price, ov_pid))
+    
+        elif os.path.exists(INPUT_CSV):
+            if OVERRIDE_COUNTY:
+                 print(f"\n!!! USING COUNTY OVERRIDE: {OVERRIDE_COUNTY} !!!")
+
+            # Read in a worker thread so the event loop keeps driving the browser launch
+            await asyncio.to_thread(read_input_tasks, INPUT_CSV, county_tasks)
+        else:
+            print(f"Input file {INPUT_CSV} not found.")
+            return
+
+        dedupe_tasks(county_tasks)
+        browser = await browser_task
+
+        # Execute batches - Clay first, then the rest
+        # (Clay uses a search workflow that requires active session management)
+        COUNTY_ORDER = ["Clay", "Duval", "Baker", "Nassau"]
+    
+        for county in COUNTY_ORDER:
+            if county in county_tasks and county_tasks[county]:
+                browser = await process_county_batch(browser, county, county_tasks[county])
+    finally:
+        # past_auction_runner runs every step in one process, so Chrome
+        # has to be stopped here rather than left for process exit
+        if browser is None:
+            # Left before taking the launched browser: cancel a launch still in
+            # flight, stop one that finished, and never re-raise a launch error
+            # over the exception already propagating
+            if not browser_task.done():
+                browser_task.cancel()
+            elif not browser_task.cancelled() and browser_task.exception() is None:
+                browser = browser_task.result()
+        if browser is not None:
+            browser.stop()
+
+def run():
+    """Synchronous entry point, used by past_auction_runner and __main__."""
+    n.loop().run_until_complete(main())
 
 if __name__ == '__main__':
-    n.loop().run_until_complete(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -1,10 +1,13 @@
 import asyncio
 import nodriver as n
 import csv
+import glob
+import json
 import logging
 import os
 import sys  # Added for path manipulation
-from lxml import html
+from lxml import etree, html
+from collections import Counter
 from datetime import datetime
 
 # --- 1. CONFIGURATION & XPATH SELECTORS ---
@@ -27,6 +30,19 @@ except ImportError:
 # Proxy Configuration
 PROXY_FILE = os.path.join(PROJECT_ROOT, "proxies.txt")
 
+# Persistent Chrome profile so each run starts warm
+try:
+    from browser_config import profile_dir
+    CHROME_PROFILE = profile_dir("past_tax_sale")
+except ImportError:
+    CHROME_PROFILE = None
+
+# Faster event loop where available (uvloop has no Windows build)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # List of counties to scrape (county_name, calendar_url)
 # Clay goes first because it's a pain and may need manual intervention
 ALL_COUNTIES = [
@@ -48,6 +64,13 @@ LOG_FILE = os.path.join(AUCTION_DIR, "logs", f"tax_sale_scrape_{RUN_TIMESTAMP}.l
 os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
+# Auction dates scraped at once, one tab each (override with DATE_CONCURRENCY)
+DATE_CONCURRENCY = max(1, int(os.environ.get("DATE_CONCURRENCY", "3")))
+
+# Attach to an already running Chrome instead of launching one, e.g. CDP_URL=http://127.0.0.1:9222
+# (start it once with --remote-debugging-port=9222; proxy and window args then don't apply)
+CDP_URL = os.environ.get("CDP_URL")
+
 # --- Configure Logging ---
 logging.basicConfig(
     level=logging.INFO,
@@ -71,19 +94,34 @@ XP_MSG_WAITING      = '//div[contains(@class, "Sub_Title") and contains(text(),
 XP_MSG_CLOSED       = '//div[contains(@class, "Sub_Title") and contains(text(), "Auctions Closed")]'
 XP_NEXT_PAGE_BTN    = '(//div[./div[contains(text(),"Auctions Closed or Canceled")]]//span[contains(@class, "PageRight")])[1]'
 
+# Same items as XP_AUCTION_ITEMS, for the browser's CSS selector engine
+CSS_AUCTION_ITEMS   = 'div.AUCTION_ITEM.PREVIEW'
+
 # --- XPath Selectors Auction Items ---
-XP_ITEM_ADDRESS_PART1 = './/tr[./td[text()="Property Address:"]]/td[2]'
-XP_ITEM_ADDRESS_PART2 = './/tr[./td[text()="Property Address:"]]/following-sibling::tr[1]/td[2]'
 XP_SALE_AMOUNT = './/div[@class="ASTAT_MSGD Astat_DATA"]'
-XP_ASSESSED_VALUE = './/tr[./td[text()="Assessed Value:"]]/td[2]'
-XP_OPENING_BID = './/tr[./td[text()="Opening Bid:"]]/td[2]'
-XP_PARCEL_ID = './/tr[./td[text()="Parcel ID:"]]/td[2]/a'
 XP_CURRENT_PAGE = '//input[@id="curPCA"]'
 XP_FINAL_PAGE = '//span[@id="maxCA"]'
 
 # Item inner detail selectors (relative to item)
 XP_ITEM_LINK        = './/a[contains(@href, "Detail.aspx")]'
 
+# Compiled once; run against a single lxml parse of each page's auction items
+FIND_SALE_AMOUNT = etree.XPath(XP_SALE_AMOUNT)
+
+# Item detail rows read by label: "<td>Label:</td><td>value</td>"
+ITEM_FIELD_LABELS = {"Property Address:", "Assessed Value:", "Opening Bid:", "Parcel ID:"}
+
+# Shared parser for auction item markup; comments and the id index are never used
+RESULTS_PAGE_PARSER = html.HTMLParser(remove_comments=True, collect_ids=False)
+
+
+# Resources the scraper never reads; blocking them cuts page weight per navigation
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+
 
 # --- 2. HELPER FUNCTIONS ---
 
@@ -92,92 +130,222 @@ class ElementMissingError(Exception):
     pass
 
 
-# --- 3. LOGICAL STEP FUNCTIONS ---
+XPATH_EXISTS_JS = "!!document.evaluate(%s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
 
-async def step_check_stop_condition(tab):
-    """Checks if we hit the 'Auctions Waiting' section."""
+async def wait_adaptive(tab, xpath, initial=0.2, max_wait=3):
+    """
+    Wait for *xpath* to match, re-probing after delays of 0.2s, 0.4s, 0.8s, then 1s.
+    Returns True as soon as it matches, False after max_wait (the old fixed sleep).
+    """
+    expression = XPATH_EXISTS_JS % json.dumps(xpath)
+    delay = initial
+    elapsed = 0
+    while True:
+        try:
+            if await tab.evaluate(expression):
+                return True
+        except Exception:
+            pass
+        if elapsed >= max_wait:
+            return False
+        await asyncio.sleep(delay)
+        elapsed += delay
+        delay = min(delay * 2, 1.0)
+
+
+async def wait_until(tab, expression, timeout, poll_interval=0.1):
+    """Poll a boolean in-page expression; returns True once it holds, False on timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            if await tab.evaluate(expression):
+                return True
+        except Exception:
+            pass
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(poll_interval)
+
+
+# Resolves true as soon as a DOM mutation makes the condition hold, false at the deadline
+DOM_CONDITION_JS = """
+new Promise((resolve) => {
+    const check = () => { try { return !!(%s); } catch (e) { return false; } };
+    if (check()) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (check()) { observer.disconnect(); clearTimeout(deadline); resolve(true); }
+    });
+    const deadline = setTimeout(() => { observer.disconnect(); resolve(check()); }, %d);
+    observer.observe(document.documentElement, {attributes: true, childList: true, characterData: true, subtree: true});
+})
+"""
+
+
+async def wait_for_dom(tab, expression, timeout):
+    """Like wait_until, but the page pushes the change instead of being polled; same-document updates only."""
+    script = DOM_CONDITION_JS % (expression, int(timeout * 1000))
     try:
-        waiting_els = await tab.xpath(XP_MSG_WAITING)
-        waiting_found = len(waiting_els) > 0
-    except Exception:
-        waiting_found = False
-    
+        return bool(await asyncio.wait_for(tab.evaluate(script, await_promise=True), timeout + 5))
+    except Exception as e:
+        # A navigation mid-wait discards the promise; fall back to polling the new document
+        logger.warning(f"   DOM watch failed ({e}), polling instead")
+        return await wait_until(tab, expression, timeout)
+
+
+async def block_heavy_resources(tab):
+    """Tell Chrome not to fetch images, fonts, media, or trackers for this tab."""
+    # Built outside the try so a wrong CDP helper name fails loudly
+    # (nodriver's generated name for Network.setBlockedURLs is set_blocked_ur_ls)
+    block_command = n.cdp.network.set_blocked_ur_ls(urls=BLOCKED_URL_PATTERNS)
     try:
-        closed_els = await tab.xpath(XP_MSG_CLOSED)
-        closed_found = len(closed_els) > 0
-    except Exception:
-        closed_found = False
-    
-    # Stop if waiting found but closed not found
-    if waiting_found and not closed_found:
-        return True
-    return False
+        await tab.send(n.cdp.network.enable())
+        await tab.send(block_command)
+    except Exception as e:
+        logger.warning(f"Could not enable resource blocking: {e}")
+
+
+# --- 3. LOGICAL STEP FUNCTIONS ---
+
+# Page number shown by the results pager (curPCA's curpg attribute)
+CURRENT_PAGE_JS = "parseInt((document.getElementById('curPCA') || {getAttribute: () => null}).getAttribute('curpg') || '1')"
+
+# Pager's page count (maxCA text) and current page (curPCA's curpg), null where missing
+PAGER_JS = (
+    "JSON.stringify({"
+    "total: ((el) => el ? el.textContent : null)(document.getElementById('maxCA')), "
+    "current: ((el) => el ? el.getAttribute('curpg') || '1' : null)(document.getElementById('curPCA'))"
+    "})"
+)
+
+# Text of the first auction item, used to tell when a new results page has rendered
+FIRST_ITEM_TEXT_JS = (
+    "((el) => el ? el.textContent : null)(document.querySelector(%s))" % json.dumps(CSS_AUCTION_ITEMS)
+)
 
-async def step_get_date(tab):
-    """Extracts the date string from the header."""
-    date_els = await tab.xpath(XP_AUCTION_DATE)
-    if not date_els:
-        raise ElementMissingError("Could not find auction date element")
-    return date_els[0].text.strip()
+# Item count plus the markup of just the sold items, without the surrounding layout
+SOLD_ITEMS_JS = """
+(() => {
+    const items = Array.from(document.querySelectorAll(%s));
+    return JSON.stringify({
+        count: items.length,
+        sold: items.filter((el) => el.textContent.includes('Auction Sold')).map((el) => el.outerHTML),
+    });
+})()
+""" % json.dumps(CSS_AUCTION_ITEMS)
+
+# Calendar month header text, e.g. "January 2025" (first text node, like nodriver's .text)
+CAL_DATE_TEXT_JS = (
+    "((el) => el ? (document.createTreeWalker(el, NodeFilter.SHOW_TEXT).nextNode() || {nodeValue: ''}).nodeValue.trim() : null)"
+    "(document.evaluate(%s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue)"
+    % json.dumps(XP_CAL_CURRENT_DATE)
+)
 
-async def step_extract_items(tab, county_name, current_date, writer, file_handle):
-    """Finds all items on current view, parses them, writes to CSV."""
+# Calendar month header plus every auction day's dayid, in one round-trip
+CAL_MONTH_SNAPSHOT_JS = """
+(() => {
+    const days = document.evaluate(%s, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const dayids = [];
+    for (let i = 0; i < days.snapshotLength; i++) dayids.push(days.snapshotItem(i).getAttribute('dayid'));
+    return JSON.stringify({date: %s, dayids: dayids});
+})()
+""" % (json.dumps(XP_CAL_AUCTION_DAYS), CAL_DATE_TEXT_JS)
+
+# One round-trip for the per-date checks; "date" mirrors nodriver's .text (first text node)
+PAGE_SNAPSHOT_JS = """
+(() => {
+    const first = (xp) => document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const dateEl = first(%s);
+    const dateText = dateEl ? document.createTreeWalker(dateEl, NodeFilter.SHOW_TEXT).nextNode() : null;
+    return JSON.stringify({
+        waiting: !!first(%s),
+        closed: !!first(%s),
+        date: dateText ? dateText.nodeValue.trim() : null,
+    });
+})()
+""" % (json.dumps(XP_AUCTION_DATE), json.dumps(XP_MSG_WAITING), json.dumps(XP_MSG_CLOSED))
+
+async def step_page_snapshot(tab):
+    """Returns {waiting, closed, date} for the current auction page in one evaluate."""
+    return json.loads(await tab.evaluate(PAGE_SNAPSHOT_JS))
+
+def item_field_cells(item):
+    """Maps each labelled detail row of an item to its value cell in one pass over its rows."""
+    cells = {}
+    for row in item.iter('tr'):
+        tds = row.findall('td')
+        if len(tds) < 2:
+            continue
+        for td in tds:
+            if td.text in ITEM_FIELD_LABELS and td.text not in cells:
+                cells[td.text] = tds[1]
+                if td.text == "Property Address:":
+                    # City/state/zip sits in the next row's value cell
+                    cells["Property Address 2"] = row.getnext().findall('td')[1]
+    return cells
+
+async def step_extract_items(tab, county_name, current_date, auction_day):
+    """Finds all items on current view and returns the sold ones as CSV rows."""
     
-    # Get all auction item divs using XPath (xpath returns a list)
-    items = await tab.xpath(XP_AUCTION_ITEMS)
+    # Fetch just the sold items' markup and parse it once; every item is read from this tree
+    page = json.loads(await tab.evaluate(SOLD_ITEMS_JS))
     
-    if not items:
+    if not page["count"]:
         raise ElementMissingError("No auction items found on page")
 
+    items = list(html.fromstring("<div>%s</div>" % "".join(page["sold"]), parser=RESULTS_PAGE_PARSER))
+
+    batch = []
     for item in items:
         try:
-            if "Auction Sold" not in item.text:
-                continue # skip it if it's not sold
-            
-            item_html = await item.get_html()
-            tree = html.fromstring(item_html)
+            cells = item_field_cells(item)
 
             # Property Address
-            address_1 = tree.xpath(XP_ITEM_ADDRESS_PART1)[0].text_content().strip()
-            address_2 = tree.xpath(XP_ITEM_ADDRESS_PART2)[0].text_content().strip()
+            address_1 = cells["Property Address:"].text_content().strip()
+            address_2 = cells["Property Address 2"].text_content().strip()
             address = f"{address_1}, {address_2}"
 
             # Sale Amount
-            sale_amount = tree.xpath(XP_SALE_AMOUNT)[0].text_content().strip()
+            sale_amount = FIND_SALE_AMOUNT(item)[0].text_content().strip()
 
             # Assessed Value
-            assessed_value = tree.xpath(XP_ASSESSED_VALUE)[0].text_content().strip()
+            assessed_value = cells["Assessed Value:"].text_content().strip()
 
             # Opening Bid
-            opening_bid = tree.xpath(XP_OPENING_BID)[0].text_content().strip()
+            opening_bid = cells["Opening Bid:"].text_content().strip()
 
             # Parcel ID
-            parcel_id_raw = tree.xpath(XP_PARCEL_ID)[0]
+            parcel_id_raw = cells["Parcel ID:"].find('a')
             parcel_id = parcel_id_raw.text_content().strip()
             parcel_link = parcel_id_raw.get('href')
 
-            # Write to CSV
-            writer.writerow([county_name, current_date, parcel_id, address, sale_amount, assessed_value, opening_bid, parcel_link])
-            file_handle.flush()
+            batch.append([county_name, current_date, parcel_id, address, sale_amount, assessed_value, opening_bid, parcel_link, auction_day])
 
         except Exception as e:
             logger.error(f"   Error parsing item: {e}")
             continue
 
-async def step_next_page_of_items(tab):
-    """Looks for a pagination 'Next' button and clicks it if not on the last page."""
+    return batch
+
+async def step_next_page_of_items(tab, pager):
+    """
+    Looks for a pagination 'Next' button and clicks it if not on the last page.
+    pager is a per-date dict caching the page count and the page we're on,
+    so the pager elements are only read from the DOM on the first call.
+    """
     try:
-        # Get total number of pages from XP_FINAL_PAGE (span text)
-        final_page_els = await tab.xpath(XP_FINAL_PAGE)
-        if not final_page_els:
-            raise ElementMissingError("Could not find max page element (XP_FINAL_PAGE)")
-        total_pages = int(final_page_els[0].text.strip())
-        
-        # Get current page - use apply() to get fresh attribute from DOM
-        current_page_els = await tab.xpath(XP_CURRENT_PAGE)
-        if not current_page_els:
-            raise ElementMissingError("Could not find current page element (XP_CURRENT_PAGE)")
-        current_page = int(await current_page_els[0].apply("(el) => el.getAttribute('curpg') || '1'"))
+        if "total" not in pager:
+            # Read total pages (XP_FINAL_PAGE) and current page (XP_CURRENT_PAGE) in one evaluate
+            pager_info = json.loads(await tab.evaluate(PAGER_JS))
+            if pager_info["total"] is None:
+                raise ElementMissingError("Could not find max page element (XP_FINAL_PAGE)")
+            pager["total"] = int(pager_info["total"].strip())
+            
+            if pager_info["current"] is None:
+                raise ElementMissingError("Could not find current page element (XP_CURRENT_PAGE)")
+            pager["current"] = int(pager_info["current"])
+        total_pages = pager["total"]
+        current_page = pager["current"]
         
         logger.info(f"   Page {current_page} of {total_pages}")
         
@@ -187,25 +355,58 @@ async def step_next_page_of_items(tab):
         
         next_btns = await tab.xpath(XP_NEXT_PAGE_BTN)
         if next_btns:
+            first_item = await tab.evaluate(FIRST_ITEM_TEXT_JS)
             logger.info("   -> Clicking Next Page (Inner)...")
             await next_btns[0].click()
             
-            # Wait for the page number to actually change using apply() for fresh values
+            # Wait until the page number advances and the new items have replaced the old ones
             expected_page = current_page + 1
-            for _ in range(30):  # Max 30 attempts, ~15 seconds total
-                await asyncio.sleep(0.5)
-                current_page_els = await tab.xpath(XP_CURRENT_PAGE)
-                if current_page_els:
-                    new_page = int(await current_page_els[0].apply("(el) => el.getAttribute('curpg') || '1'"))
-                    if new_page >= expected_page:
-                        # Short pause to let page fully render
-                        await asyncio.sleep(0.5)
-                        break
+            changed = f"{CURRENT_PAGE_JS} >= {expected_page} && {FIRST_ITEM_TEXT_JS} !== {json.dumps(first_item)}"
+            if await wait_for_dom(tab, changed, timeout=15):
+                pager["current"] = expected_page
+            else:
+                logger.warning(f"   Page {expected_page} did not render within 15s")
+                pager["current"] = int(await tab.evaluate(CURRENT_PAGE_JS))
             return True
     except Exception as e:
         logger.error(f"   Error in pagination: {e}")
     return False
 
+async def scrape_auction_date(tab, county_name, auction_url, auction_date):
+    """Scrapes every results page of one auction date; returns its sold rows."""
+    await tab.get(auction_url)
+    await wait_adaptive(tab, XP_AUCTION_ITEMS)
+    
+    snapshot = await step_page_snapshot(tab)
+
+    # Stop if waiting found but closed not found - no closed sales on this date
+    if snapshot["waiting"] and not snapshot["closed"]:
+        logger.info(f"   Skipping {auction_date} - no closed sales (waiting auctions only).")
+        return []
+    
+    # Get the date string from the page header
+    date_str = snapshot["date"]
+    if not date_str:
+        logger.warning(f"   Could not get date from page for {auction_date}. Skipping.")
+        return []
+    
+    logger.info(f"   {auction_date} page shows: {date_str}")
+    
+    # Inner Loop: Extract items from all pages
+    rows = []
+    pager = {}
+    while True:
+        try:
+            rows.extend(await step_extract_items(tab, county_name, date_str, auction_date))
+        except ElementMissingError as e:
+            logger.warning(f"   {e}")
+            break
+        
+        has_next_page = await step_next_page_of_items(tab, pager)
+        if not has_next_page:
+            break
+    return rows
+
 async def collect_auction_dates_from_calendar(tab, calendar_url):
     """
     Navigates through the calendar and collects all auction date dayids.
@@ -217,15 +418,15 @@ async def collect_auction_dates_from_calendar(tab, calendar_url):
     
     logger.info("Navigating to calendar page...")
     await tab.get(calendar_url)
-    await asyncio.sleep(3)
+    await wait_adaptive(tab, XP_CAL_CURRENT_DATE)
     
     while True:
-        # Get current calendar month/year from the page
-        cal_date_els = await tab.xpath(XP_CAL_CURRENT_DATE)
-        if not cal_date_els:
+        # Get current calendar month/year and its auction days from the page
+        month = json.loads(await tab.evaluate(CAL_MONTH_SNAPSHOT_JS))
+        if month["date"] is None:
             raise ElementMissingError("Could not find calendar date element (XP_CAL_CURRENT_DATE)")
         
-        cal_date_text = cal_date_els[0].text.strip()  # e.g., "January 2025"
+        cal_date_text = month["date"]  # e.g., "January 2025"
         logger.info(f"Scanning calendar: {cal_date_text}")
         
         # Parse the calendar month/year
@@ -234,19 +435,15 @@ async def collect_auction_dates_from_calendar(tab, calendar_url):
         except ValueError as e:
             raise ElementMissingError(f"Could not parse calendar date '{cal_date_text}': {e}")
         
-        # Get all auction day elements on this month
-        auction_day_els = await tab.xpath(XP_CAL_AUCTION_DAYS)
-        
-        # Extract dayid from each auction day
-        for day_el in auction_day_els:
-            dayid = await day_el.apply("(el) => el.getAttribute('dayid')")
+        # Keep the dayid of each auction day
+        for dayid in month["dayids"]:
             if dayid:
                 auction_dates.append(dayid)
                 logger.info(f"   Found auction date: {dayid}")
         
         # Check stop condition: no auction days AND calendar is beyond current month,
         # OR calendar is more than 3 months into the future (safety net)
-        has_auction_days = len(auction_day_els) > 0
+        has_auction_days = len(month["dayids"]) > 0
         months_ahead = (cal_date.year - current_real_date.year) * 12 + (cal_date.month - current_real_date.month)
         is_future_month = months_ahead > 0
 
@@ -269,23 +466,12 @@ async def collect_auction_dates_from_calendar(tab, calendar_url):
                 logger.info("No next month button found. Stopping calendar scan.")
                 break
             
-            # Wait for button to be ready
-            await asyncio.sleep(0.5)
-            
             logger.info(f"   -> Clicking Next Month... (attempt {retry + 1}/{max_retries})")
             await next_month_btns[0].click()
             
             # Wait for the calendar month to change
-            for _ in range(20):
-                await asyncio.sleep(0.5)
-                cal_date_els = await tab.xpath(XP_CAL_CURRENT_DATE)
-                if cal_date_els:
-                    new_cal_date_text = cal_date_els[0].text.strip()
-                    if new_cal_date_text != old_cal_date_text:
-                        month_changed = True
-                        # Short pause to let page fully render
-                        await asyncio.sleep(0.5)
-                        break
+            changed = f"(({CAL_DATE_TEXT_JS}) || {json.dumps(old_cal_date_text)}) !== {json.dumps(old_cal_date_text)}"
+            month_changed = await wait_until(tab, changed, timeout=10)
             
             if month_changed:
                 break
@@ -305,6 +491,38 @@ def get_base_url(calendar_url):
     parsed = urlparse(calendar_url)
     return f"{parsed.scheme}://{parsed.netloc}"
 
+def load_previous_date_counts():
+    """
+    Counts sold rows per (county, calendar dayid) in the newest earlier tax_sales CSV.
+    Dates with more rows have more result pages, so they are scraped first.
+    Files written before the "Auction Day" column existed give no counts.
+    """
+    previous = [p for p in glob.glob(os.path.join(os.path.dirname(OUTPUT_FILE), "tax_sales_*.csv")) if p != OUTPUT_FILE]
+    counts = Counter()
+    if not previous:
+        return counts
+    try:
+        with open(max(previous), newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "County" not in header or "Auction Day" not in header:
+                return counts
+            county_i, day_i = header.index("County"), header.index("Auction Day")
+            for row in reader:
+                if len(row) > max(county_i, day_i):
+                    counts[(row[county_i], row[day_i])] += 1
+    except OSError as e:
+        logger.warning(f"Could not read previous tax sales for scheduling: {e}")
+    return counts
+
+def order_longest_first(county_name, auction_dates, previous_counts):
+    """
+    Sorts dayids by their previous row count, biggest first, so a big date doesn't
+    finish alone at the end. Dates missing from the last run count as its biggest.
+    """
+    default_count = max(previous_counts.values(), default=0)
+    return sorted(auction_dates, key=lambda d: previous_counts.get((county_name, d), default_count), reverse=True)
+
 
 # --- 4. MAIN EXECUTION ---
 
@@ -328,28 +546,45 @@ async def main():
         ext_path = os.path.join(SCRIPT_DIR, "chrome_proxy_auth_ext")
 
         # 3. Create the extension files
-        if create_proxy_auth_extension(proxy_str, ext_path):
+        ext_dir = create_proxy_auth_extension(proxy_str, ext_path)
+        if ext_dir:
             # 4. Load it into Chrome
-            browser_args.append(f"--load-extension={ext_path}")
+            browser_args.append(f"--load-extension={ext_dir}")
     else:
         print("No proxy found (or proxies.txt is missing). Running with Direct Connection.")
 
-    browser = await n.start(browser_args=browser_args)
+    if CDP_URL:
+        from urllib.parse import urlparse
+        parsed = urlparse(CDP_URL)
+        print(f"Attaching to running Chrome at {CDP_URL}")
+        browser = await n.start(host=parsed.hostname, port=parsed.port)
+    else:
+        browser = await n.start(browser_args=browser_args, user_data_dir=CHROME_PROFILE)
+
+        # Move Chrome to the correct monitor after launch
+        if move_chrome_to_vscode_monitor:
+            await asyncio.sleep(1)
+            move_chrome_to_vscode_monitor()
 
-    # Move Chrome to the correct monitor after launch
-    if move_chrome_to_vscode_monitor:
-        await asyncio.sleep(1)
-        move_chrome_to_vscode_monitor()
+    previous_counts = load_previous_date_counts()
 
+    tabs = []
     try:
         # Get initial tab
         tab = await browser.get("about:blank")
-        await asyncio.sleep(1)
+        await block_heavy_resources(tab)
+
+        # Extra tabs so several auction dates load at once; the first also scans calendars
+        tabs = [tab]
+        for _ in range(DATE_CONCURRENCY - 1):
+            extra_tab = await browser.get("about:blank", new_tab=True)
+            await block_heavy_resources(extra_tab)
+            tabs.append(extra_tab)
         
         # Open CSV file once for all counties
         with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
-            writer.writerow(["County", "Date", "Parcel ID", "Address", "Sale Amount", "Assessed Value", "Opening Bid", "Link"])
+            writer.writerow(["County", "Date", "Parcel ID", "Address", "Sale Amount", "Assessed Value", "Opening Bid", "Link", "Auction Day"])
             
             logger.info(f"Scraper Initialized. Output: {OUTPUT_FILE}")
             
@@ -368,11 +603,9 @@ async def main():
                 
                 logger.info(f"Will process {len(auction_dates)} auction dates for {county_name}.")
                 
-                # Step 2: Process each auction date
-                for i, auction_date in enumerate(auction_dates):
-                    logger.info(f"Processing auction date {i+1}/{len(auction_dates)}: {auction_date}")
-                    
-                    # Skip future auction dates - they can't have sold items
+                # Step 2: Skip future auction dates - they can't have sold items
+                past_dates = []
+                for auction_date in auction_dates:
                     try:
                         auction_dt = datetime.strptime(auction_date, "%m/%d/%Y")
                         if auction_dt.date() > datetime.now().date():
@@ -380,45 +613,60 @@ async def main():
                             continue
                     except ValueError:
                         pass  # If date parsing fails, try to process anyway
-                    
-                    # Navigate to auction page for this date
-                    auction_url = auction_url_template.format(date=auction_date)
-                    await tab.get(auction_url)
-                    await asyncio.sleep(3)
-                    
-                    # Check if this auction has closed sales
-                    should_skip = await step_check_stop_condition(tab)
-                    if should_skip:
-                        logger.info(f"   Skipping {auction_date} - no closed sales (waiting auctions only).")
-                        continue
-                    
-                    # Get the date string from the page header
-                    try:
-                        date_str = await step_get_date(tab)
-                    except ElementMissingError:
-                        logger.warning(f"   Could not get date from page for {auction_date}. Skipping.")
-                        continue
-                    
-                    logger.info(f"   Page shows: {date_str}")
-                    
-                    # Inner Loop: Extract items from all pages
+                    past_dates.append(auction_date)
+
+                # Longest dates first, by last run's rows per calendar dayid
+                past_dates = order_longest_first(county_name, past_dates, previous_counts)
+
+                # Step 3: Scrape the dates across the tab pool, writing each date's rows as it finishes
+                write_lock = asyncio.Lock()
+
+                def write_rows(rows):
+                    writer.writerows(rows)
+                    f.flush()
+
+                todo = asyncio.Queue()
+                for item in enumerate(past_dates, 1):
+                    todo.put_nowait(item)
+
+                async def date_worker(worker_tab):
                     while True:
                         try:
-                            await step_extract_items(tab, county_name, date_str, writer, f)
-                        except ElementMissingError as e:
-                            logger.warning(f"   {e}")
-                            break
-                        
-                        has_next_page = await step_next_page_of_items(tab)
-                        if not has_next_page:
-                            break
+                            i, auction_date = todo.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        logger.info(f"Processing auction date {i}/{len(past_dates)}: {auction_date}")
+                        auction_url = auction_url_template.format(date=auction_date)
+                        try:
+                            rows = await scrape_auction_date(worker_tab, county_name, auction_url, auction_date)
+                        except Exception as e:
+                            logger.error(f"   Error processing {auction_date}: {e}")
+                            continue
+                        # Disk writes run off the event loop so the other tabs keep scraping
+                        async with write_lock:
+                            await asyncio.to_thread(write_rows, rows)
+
+                await asyncio.gather(*(date_worker(t) for t in tabs))
         
         logger.info("Scraping complete!")
         
     except Exception as e:
         logger.error(f"Fatal error: {e}")
     finally:
-        browser.stop()
+        if CDP_URL:
+            # Leave the shared browser running; just close the extra tabs we opened
+            for extra_tab in tabs[1:]:
+                await extra_tab.close()
+        else:
+            browser.stop()
+
+def run():
+    """Synchronous entry point, used by past_auction_runner and __main__."""
+    if uvloop is not None:
+        # Scoped to this run; past_auction_runner runs later steps in the same process
+        uvloop.run(main())
+    else:
+        n.loop().run_until_complete(main())
 
 if __name__ == '__main__':
-    n.loop().run_until_complete(main())
\ No newline at end of file
+    run()
\ No newline at end of file
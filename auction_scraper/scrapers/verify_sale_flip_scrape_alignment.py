@@ -1,6 +1,13 @@
 import csv
 import os
+import sys
 import glob
+import fnmatch
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 # --- CONFIGURATION ---
 
@@ -27,7 +34,13 @@ TARGET_FILES = [
 
 # --- LOGIC ---
 
-def normalize_pid(pid):
+# Read buffer for the CSV walks; coalesces read() syscalls on large files
+READ_BUFFER = 1 << 20
+
+# Placeholder values that don't identify a parcel (compared lowercased)
+BAD_PIDS = frozenset({"n/a", "", "parcel id"})
+
+def normalize_pid(pid, _bad=BAD_PIDS):
     """
     Standardizes Parcel IDs for comparison.
     - Removes surrounding whitespace.
@@ -36,9 +49,68 @@ def normalize_pid(pid):
     if not pid:
         return None
     cleaned = pid.strip()
-    if cleaned.lower() in ["n/a", "", "parcel id"]:
-        return None
-    return cleaned
+    return None if cleaned.lower() in _bad else cleaned
+
+def column_indices(header):
+    """Maps each header name to its (first) column index in one pass."""
+    cols = {}
+    for i, name in enumerate(header):
+        cols.setdefault(name, i)
+    return cols
+
+def read_pids(filename):
+    """
+    Returns the normalized Parcel IDs in one output CSV, or None if it has no
+    "Parcel ID" column. Uses pandas (C parser, one column) when installed.
+    """
+    if pd is not None:
+        # Check the header first so a malformed file raises instead of looking column-less
+        with open(filename, 'r', encoding='utf-8-sig', newline='') as f:
+            if "Parcel ID" not in column_indices(next(csv.reader(f), [])):
+                return None
+        col = pd.read_csv(filename, usecols=["Parcel ID"], dtype=str,
+                          encoding="utf-8-sig", keep_default_na=False)["Parcel ID"]
+        col = col.dropna().str.strip()
+        return col[~col.str.lower().isin(BAD_PIDS)].tolist()
+
+    with open(filename, 'r', encoding='utf-8-sig', newline='', buffering=READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Adjust column name if you changed it in the scraper
+        # We expect "Parcel ID" based on previous scripts
+        pid_idx = column_indices(header).get("Parcel ID")
+        if pid_idx is None:
+            return None
+
+        # Local alias keeps the hot loop on a fast local lookup
+        norm = normalize_pid
+        pids = []
+        for row in reader:
+            if pid_idx < len(row):
+                pid = norm(row[pid_idx])
+                if pid:
+                    pids.append(pid)
+        return pids
+
+def latest_matches(file_patterns):
+    """
+    Maps each glob pattern to its most recent matching file (or None).
+    Each directory is listed once with scandir, however many patterns share it;
+    timestamped names sort chronologically, so the newest is the max.
+    """
+    listings = {}
+    latest = {}
+    for pattern in file_patterns:
+        directory, name_pattern = os.path.split(pattern)
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = [e.name for e in entries if e.is_file()]
+            except FileNotFoundError:
+                listings[directory] = []
+        names = fnmatch.filter(listings[directory], name_pattern)
+        latest[pattern] = os.path.join(directory, max(names)) if names else None
+    return latest
 
 def load_processed_pids(file_patterns):
     """
@@ -51,33 +123,20 @@ def load_processed_pids(file_patterns):
 
     print(f"--- Loading Data from {len(file_patterns)} Output File Patterns ---")
 
-    for pattern in file_patterns:
-        # Find all files matching the pattern
-        matching_files = glob.glob(pattern)
-        
-        if not matching_files:
+    for pattern, filename in latest_matches(file_patterns).items():
+        if filename is None:
             print(f"[WARN] No files found matching: {pattern}")
             continue
-        
-        # Use the most recent file (sorted alphabetically, timestamps sort correctly)
-        filename = sorted(matching_files)[-1]
-        
+
         try:
-            with open(filename, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                count = 0
-                for row in reader:
-                    # Adjust column name if you changed it in the scraper
-                    # We expect "Parcel ID" based on previous scripts
-                    raw_pid = row.get("Parcel ID")
-                    
-                    pid = normalize_pid(raw_pid)
-                    if pid:
-                        processed.add(pid)
-                        count += 1
-                
-                print(f"  -> {filename}: Loaded {count} records")
-                files_checked += 1
+            pids = read_pids(filename)
+            if pids is None:
+                print(f"[WARN] 'Parcel ID' column missing in {filename}")
+                continue
+            processed.update(pids)
+
+            print(f"  -> {filename}: Loaded {len(pids)} records")
+            files_checked += 1
         except Exception as e:
             print(f"[ERR] Could not read {filename}: {e}")
 
@@ -89,33 +148,39 @@ def verify_against_source(source_file, processed_set):
     Iterates through Source CSV and checks if each ID exists in the processed_set.
     Prints missing items.
     """
-    if not os.path.exists(source_file):
+    missing_rows = []
+    total_count = 0
+
+    try:
+        f = open(source_file, 'r', encoding='utf-8-sig', newline='', buffering=READ_BUFFER)
+    except FileNotFoundError:
         print(f"Error: Source file {source_file} not found.")
         return
 
-    missing_count = 0
-    total_count = 0
-
     print(f"--- Verifying against Source: {source_file} ---")
 
-    with open(source_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        
+    with f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+
+        cols = column_indices(header)
+        pid_idx = cols.get("Parcel ID")
+        county_idx = cols.get("County")
+        link_idx = cols.get("Link")
+
         # Verify Source has Parcel ID column
-        if "Parcel ID" not in reader.fieldnames:
-             print(f"Error: 'Parcel ID' column missing in {source_file}. Found: {reader.fieldnames}")
+        if pid_idx is None:
+             print(f"Error: 'Parcel ID' column missing in {source_file}. Found: {header}")
              return
 
         print(f"{'STATUS':<10} | {'COUNTY':<10} | {'PARCEL ID':<25} | {'LINK'}")
         print("-" * 80)
 
+        norm = normalize_pid
         for row in reader:
-            raw_pid = row.get("Parcel ID")
-            county = row.get("County", "Unknown")
-            link = row.get("Link", "N/A")
-            
-            pid = normalize_pid(raw_pid)
-            
+            width = len(row)
+            pid = norm(row[pid_idx] if pid_idx < width else None)
+
             # Skip rows that don't have a valid PID in the source (bad data)
             if not pid:
                 continue
@@ -123,9 +188,14 @@ def verify_against_source(source_file, processed_set):
             total_count += 1
 
             if pid not in processed_set:
-                missing_count += 1
-                print(f"{'MISSING':<10} | {county:<10} | {pid:<25} | {link}")
-
+                # County/Link are only needed for the report, so only missing rows look them up
+                county = row[county_idx] if county_idx is not None and county_idx < width else "Unknown"
+                link = row[link_idx] if link_idx is not None and link_idx < width else "N/A"
+                missing_rows.append(f"MISSING    | {county:<10} | {pid:<25} | {link}\n")
+
+    # One write for the whole report instead of a print per missing row
+    missing_count = len(missing_rows)
+    sys.stdout.write("".join(missing_rows))
     print("-" * 80)
     print(f"Verification Complete.")
     print(f"Total Rows in Source: {total_count}")
@@ -139,9 +209,13 @@ def verify_against_source(source_file, processed_set):
 
 # --- MAIN EXECUTION ---
 
-if __name__ == "__main__":
+def run():
+    """Entry point, used by past_auction_runner and __main__."""
     # 1. Load all IDs we have already scraped
     found_pids = load_processed_pids(TARGET_FILES)
     
     # 2. Compare against the master list
-    verify_against_source(SOURCE_CSV, found_pids)
\ No newline at end of file
+    verify_against_source(SOURCE_CSV, found_pids)
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+import csv
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scrapers"))
+
+import past_tax_sale_scrape as scrape
+
+HEADER = ["County", "Date", "Parcel ID", "Address", "Sale Amount", "Assessed Value", "Opening Bid", "Link", "Auction Day"]
+
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+class OrderLongestFirstTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        output_file = os.path.join(self.tmp.name, "tax_sales_2025-02-01_00-00-00.csv")
+        patcher = mock.patch.object(scrape, "OUTPUT_FILE", output_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sale(self, county, day):
+        # "Date" is the page header text, deliberately not in dayid format
+        return [county, f"Auctions for {day}", "P", "A", "$1", "$1", "$1", "L", day]
+
+    def test_previous_run_reorders_past_dates(self):
+        write_csv(os.path.join(self.tmp.name, "tax_sales_2025-01-01_00-00-00.csv"), HEADER, [
+            self.sale("Clay", "01/08/2025"),
+            self.sale("Clay", "01/08/2025"),
+            self.sale("Clay", "01/08/2025"),
+            self.sale("Clay", "01/01/2025"),
+            self.sale("Clay", "01/15/2025"),
+            self.sale("Clay", "01/15/2025"),
+        ])
+        counts = scrape.load_previous_date_counts()
+
+        past_dates = ["01/01/2025", "01/08/2025", "01/15/2025", "01/22/2025"]
+        ordered = scrape.order_longest_first("Clay", past_dates, counts)
+
+        # 01/22 is new, so it counts as the biggest (3) and keeps its place among ties
+        self.assertEqual(ordered, ["01/08/2025", "01/22/2025", "01/15/2025", "01/01/2025"])
+
+    def test_csv_without_auction_day_keeps_calendar_order(self):
+        write_csv(os.path.join(self.tmp.name, "tax_sales_2025-01-01_00-00-00.csv"), HEADER[:-1], [
+            ["Clay", "01/08/2025", "P", "A", "$1", "$1", "$1", "L"],
+        ])
+        counts = scrape.load_previous_date_counts()
+
+        past_dates = ["01/01/2025", "01/08/2025"]
+        self.assertEqual(scrape.order_longest_first("Clay", past_dates, counts), past_dates)
+
+
+if __name__ == "__main__":
+    unittest.main()
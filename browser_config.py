@@ -3,6 +3,8 @@ Shared browser configuration for all nodriver scrapers.
 Single source of truth for headless Chrome settings in containerized environments.
 """
 
+import os
+
 BROWSER_ARGS = [
     "--no-sandbox",
     "--disable-setuid-sandbox",
@@ -12,3 +14,29 @@ BROWSER_ARGS = [
 ]
 
 HEADLESS = True
+
+# Persistent Chrome profile root, reused across runs so launches start warm
+# instead of bootstrapping a blank profile. Each scraper gets its own subdir
+# because Chrome locks a profile to one running instance.
+CHROME_PROFILE_DIR = os.environ.get(
+    "CHROME_PROFILE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "dailyautomation", "chrome-profile"),
+)
+
+
+def profile_dir(name):
+    """Return the persistent profile directory for the named scraper."""
+    return os.path.join(CHROME_PROFILE_DIR, name)
+
+
+# HTTP disk cache kept outside the profile so scrapers that must start from a
+# clean profile (cookies, proxy rotation) can still reuse cached JS/CSS.
+DISK_CACHE_SIZE = 100 * 1024 * 1024
+
+
+def disk_cache_args(name):
+    """Chrome args for a persistent, size-capped HTTP cache for the named scraper."""
+    return [
+        f"--disk-cache-dir={os.path.join(CHROME_PROFILE_DIR, name + '-cache')}",
+        f"--disk-cache-size={DISK_CACHE_SIZE}",
+    ]
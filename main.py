@@ -43,17 +43,21 @@ WORKOUT_TIMEOUT = 30    # 30 seconds — plain HTTP GET, no browser
 # ---------------------------------------------------------------------------
 WORKOUT_URL = "https://workout-tracker-hxg5.onrender.com/"
 
+# One session for every keep-alive ping so the TCP/TLS connection is reused
+# between checks instead of re-handshaking each time (checks never overlap)
+workout_session = requests.Session()
+
 
 async def check_workout_site():
     try:
-        resp = await asyncio.to_thread(requests.get, WORKOUT_URL, timeout=10)
+        resp = await asyncio.to_thread(workout_session.get, WORKOUT_URL, timeout=10)
         logger.info(f"Workout tracker: HTTP {resp.status_code} ({len(resp.content)} bytes)")
     except Exception as e:
         logger.error(f"Workout tracker error: {e}")
 
 
 # ---------------------------------------------------------------------------
-# 2.  Main loop
+# 2.  Main loops
 # ---------------------------------------------------------------------------
 SAM_INTERVAL = 3600  # 1 hour
 JUNKYARD_INTERVAL = 3600  # 1 hour
@@ -98,7 +102,15 @@ async def run_loop():
                 logger.error(f"SAM pipeline top-level error: {exc}")
             last_sam_run = time.time()
 
-        # Workout keep-alive (every 1-3 min)
+        sleep_secs = random.randint(60, 180)
+        logger.info(f"Sleeping {sleep_secs}s …")
+        sys.stdout.flush()
+        await asyncio.sleep(sleep_secs)
+
+
+async def workout_loop():
+    """Workout keep-alive (every 1-3 min), on its own cadence so long pipelines can't delay it."""
+    while True:
         try:
             await asyncio.wait_for(check_workout_site(), timeout=WORKOUT_TIMEOUT)
         except asyncio.TimeoutError:
@@ -106,11 +118,13 @@ async def run_loop():
         except Exception as exc:
             logger.error(f"Workout check error: {exc}")
 
-        sleep_secs = random.randint(60, 180)
-        logger.info(f"Sleeping {sleep_secs}s …")
-        sys.stdout.flush()
-        await asyncio.sleep(sleep_secs)
+        await asyncio.sleep(random.randint(60, 180))
+
+
+async def run_services():
+    """Run the scraper loop and the workout keep-alive side by side."""
+    await asyncio.gather(run_loop(), workout_loop())
 
 
 if __name__ == "__main__":
-    uc.loop().run_until_complete(run_loop())
\ No newline at end of file
+    uc.loop().run_until_complete(run_services())
\ No newline at end of file
@@ -1,10 +1,43 @@
+import hashlib
 import os
 import random
 
+# Static manifest shared by every generated proxy extension
+MANIFEST_JSON_BYTES = """
+{
+    "version": "1.0.0",
+    "manifest_version": 2,
+    "name": "Chrome Proxy",
+    "permissions": [
+        "proxy",
+        "tabs",
+        "unlimitedStorage",
+        "storage",
+        "<all_urls>",
+        "webRequest",
+        "webRequestBlocking"
+    ],
+    "background": {
+        "scripts": ["background.js"]
+    },
+    "minimum_chrome_version":"22.0.0"
+}
+""".encode("utf-8")
+
+def _write_bytes(path, data):
+    """Write raw bytes with a single open/write/close, no text-mode codec setup."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 def create_proxy_auth_extension(proxy_string, plugin_dir):
     """
     Parses a proxy string (ip:port:user:pass) and creates a Chrome extension
-    to handle the authentication automatically.
+    to handle the authentication automatically. Each proxy gets its own
+    subfolder of plugin_dir, written once and reused on later calls; the
+    folder path is returned.
     """
     try:
         # Parse the Webshare format: ip:port:user:pass
@@ -15,26 +48,12 @@ def create_proxy_auth_extension(proxy_string, plugin_dir):
 
         ip, port, user, password = parts
 
-        manifest_json = """
-        {
-            "version": "1.0.0",
-            "manifest_version": 2,
-            "name": "Chrome Proxy",
-            "permissions": [
-                "proxy",
-                "tabs",
-                "unlimitedStorage",
-                "storage",
-                "<all_urls>",
-                "webRequest",
-                "webRequestBlocking"
-            ],
-            "background": {
-                "scripts": ["background.js"]
-            },
-            "minimum_chrome_version":"22.0.0"
-        }
-        """
+        # background.js is written last, so its presence means the folder is complete
+        digest = hashlib.blake2b(proxy_string.strip().encode(), digest_size=8).hexdigest()
+        ext_dir = os.path.join(plugin_dir, digest)
+        background_path = os.path.join(ext_dir, "background.js")
+        if os.path.exists(background_path):
+            return ext_dir
 
         background_js = f"""
         var config = {{
@@ -67,29 +86,34 @@ def create_proxy_auth_extension(proxy_string, plugin_dir):
         );
         """
 
-        os.makedirs(plugin_dir, exist_ok=True)
-        
-        with open(os.path.join(plugin_dir, "manifest.json"), "w") as f:
-            f.write(manifest_json)
+        os.makedirs(ext_dir, exist_ok=True)
 
-        with open(os.path.join(plugin_dir, "background.js"), "w") as f:
-            f.write(background_js)
+        _write_bytes(os.path.join(ext_dir, "manifest.json"), MANIFEST_JSON_BYTES)
+        _write_bytes(background_path, background_js.encode("utf-8"))
 
-        return plugin_dir
+        return ext_dir
 
     except Exception as e:
         print(f"Error creating proxy extension: {e}")
         return None
 
+# Parsed proxies.txt, reused until the file's mtime changes
+_PROXY_CACHE = {"path": None, "mtime": None, "lines": []}
+
 def get_random_proxy(proxies_file_path):
-    """Reads proxies.txt and returns a random proxy string."""
-    if not os.path.exists(proxies_file_path):
+    """Reads proxies.txt (cached until it changes) and returns a random proxy string."""
+    try:
+        mtime = os.stat(proxies_file_path).st_mtime_ns
+    except FileNotFoundError:
         print(f"Proxy file not found: {proxies_file_path}")
         return None
-        
-    with open(proxies_file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
+
+    if _PROXY_CACHE["path"] != proxies_file_path or _PROXY_CACHE["mtime"] != mtime:
+        with open(proxies_file_path, 'r') as f:
+            lines = [line.strip() for line in f if line.strip()]
+        _PROXY_CACHE.update(path=proxies_file_path, mtime=mtime, lines=lines)
+
+    lines = _PROXY_CACHE["lines"]
     if not lines:
         return None
         
@@ -17,24 +17,30 @@ import logging
 import os
 import smtplib
 import sys
+from datetime import datetime
 from email.mime.text import MIMEText
 
+import nodriver as uc
 from dotenv import load_dotenv
 
 load_dotenv()
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from browser_config import BROWSER_ARGS, HEADLESS
+from browser_config import BROWSER_ARGS, HEADLESS, profile_dir
 from sam_contracts.sam_link_scraper import scrape_index
 from sam_contracts.sam_detail_scraper import scrape_details
 from sam_contracts.sam_db import (
+    BatchWriter,
     connect,
     init_schema,
-    upsert_notice,
-    upsert_notice_detail,
+    upsert_notices,
+    notice_detail_statements,
     get_stale_notices,
-    get_contacts_for_notice,
+    get_index_watermark,
+    save_index_watermark,
+    get_contacts_for_notices,
+    reset_connection,
 )
 
 logger = logging.getLogger(__name__)
@@ -88,13 +94,14 @@ def build_pipeline_email(all_rows, stale, details, db):
     if stale:
         lines.append("New/Updated Notices:")
         lines.append("-" * 40)
+        contacts_by_notice = get_contacts_for_notices(db, [row["notice_id"] for row in stale])
         for row in stale:
             lines.append(f"\n  {row.get('title', 'Untitled')}")
             lines.append(f"  ID: {row.get('notice_id', 'N/A')}")
             lines.append(f"  Updated: {row.get('updated_date', 'N/A')}")
             lines.append(f"  Link: {row.get('href', 'N/A')}")
 
-            contacts = get_contacts_for_notice(db, row["notice_id"])
+            contacts = contacts_by_notice[row["notice_id"]]
             if contacts:
                 for c in contacts:
                     contact_parts = []
@@ -127,13 +134,23 @@ async def run_sam_pipeline():
     stale = []
     details = []
 
+    browser = None
     try:
-        # Step 1: Scrape index pages
-        all_rows = await scrape_index(headless=HEADLESS, browser_args=BROWSER_ARGS)
-
-        # Step 2: Upsert index rows to DB
-        for row in all_rows:
-            upsert_notice(db, row)
+        # One browser serves both the index and the detail scrape
+        browser = await uc.start(
+            headless=HEADLESS,
+            browser_args=BROWSER_ARGS,
+            no_sandbox=True,
+            user_data_dir=profile_dir("sam_index"),
+        )
+
+        # Step 1: Scrape index pages, stopping once results reach stored notices
+        all_rows = await scrape_index(browser=browser, known_through=get_index_watermark(db))
+
+        # Step 2: Upsert index rows to DB; only a complete upsert moves the watermark,
+        # so a run that fails partway is followed by a scan back to the old one
+        upsert_notices(db, all_rows)
+        save_index_watermark(db)
         logger.info(f"Upserted {len(all_rows)} notices")
 
         # Step 3: Find notices that need detail scraping
@@ -143,17 +160,30 @@ async def run_sam_pipeline():
         # Step 4: Scrape details for stale notices + upsert
         if stale:
             urls = [row["href"] for row in stale]
-            details = await scrape_details(urls, headless=HEADLESS, browser_args=BROWSER_ARGS)
-            for i, detail in enumerate(details):
+
+            # Write each detail in the background while the next page loads
+            writer = BatchWriter(db)
+            writer.start()
+            scraped_at = datetime.now().isoformat()
+
+            def store_detail(i, detail):
                 if "error" not in detail:
                     detail["notice_id"] = stale[i]["notice_id"]
-                    upsert_notice_detail(db, detail)
+                    writer.submit(notice_detail_statements(detail, scraped_at))
+
+            try:
+                details = await scrape_details(urls, on_result=store_detail, browser=browser)
+            finally:
+                await writer.close()
             logger.info(f"Detail-scraped {len(details)} notices")
 
         logger.info("SAM.gov pipeline complete ✓")
 
     except Exception as exc:
         logger.error(f"SAM pipeline error: {exc}")
+    finally:
+        if browser is not None:
+            browser.stop()
 
     # Send email regardless
     try:
@@ -166,7 +196,8 @@ async def run_sam_pipeline():
     except Exception as exc:
         logger.error(f"Email notification error: {exc}")
     finally:
-        db.close()
+        # db is the shared connect() client; drop it so a later caller gets a fresh one
+        reset_connection()
 
 
 # ---------------------------------------------------------------------------
@@ -11,7 +11,9 @@ Environment variables (in .env):
     TURSO_AUTH_TOKEN=your-auth-token
 """
 
+import asyncio
 import hashlib
+import json
 import logging
 import os
 import re
@@ -19,12 +21,44 @@ from datetime import datetime
 
 import requests as _requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional: orjson encodes/decodes pipeline bodies several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Every pipeline request ends by closing its stream
+_CLOSE_REQ = {"type": "close"}
+
+# Hrana argument encoders keyed on exact type; bool must not fall into int
+_NULL_VALUE = {"type": "null"}
+_TYPED_VALUES = {
+    type(None): lambda v: _NULL_VALUE,
+    bool: lambda v: {"type": "integer", "value": "1" if v else "0"},
+    int: lambda v: {"type": "integer", "value": str(v)},
+    float: lambda v: {"type": "float", "value": v},
+    str: lambda v: {"type": "text", "value": v},
+}
+
+
 # ---------------------------------------------------------------------------
 # Low-level HTTP client for Turso /v2/pipeline
 # ---------------------------------------------------------------------------
@@ -38,6 +72,17 @@ class TursoClient:
         self.base_url = url.replace("libsql://", "https://")
         self.pipeline_url = f"{self.base_url}/v2/pipeline"
 
+        # One pooled keep-alive session so every statement reuses the TLS
+        # connection; auth headers are set once here rather than per call.
+        # Retries cover connection failures (POSTs aren't re-sent on 5xx).
+        self._session = _requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        ))
+        self._session.headers.update(self._headers())
+
     def _headers(self):
         return {
             "Authorization": f"Bearer {self.token}",
@@ -46,8 +91,10 @@ class TursoClient:
 
     @staticmethod
     def _typed_value(v):
-        if v is None:
-            return {"type": "null"}
+        encode = _TYPED_VALUES.get(type(v))
+        if encode is not None:
+            return encode(v)
+        # Subclasses (e.g. IntEnum) and anything else
         if isinstance(v, bool):
             return {"type": "integer", "value": str(int(v))}
         if isinstance(v, int):
@@ -79,28 +126,47 @@ class TursoClient:
             ))
         return {"columns": columns, "rows": rows}
 
-    def execute(self, sql, params=None):
-        body = {
-            "requests": [
-                {"type": "execute", "stmt": self._make_stmt(sql, params)},
-                {"type": "close"},
-            ]
-        }
-        resp = _requests.post(self.pipeline_url, json=body, headers=self._headers())
+    @staticmethod
+    def _parse_dict_rows(result):
+        """Like _parse_result, but builds one dict per row straight from the JSON cells."""
+        if result["type"] == "error":
+            raise Exception(f"Turso error: {result['error']['message']}")
+        resp = result["response"]["result"]
+        columns = [c["name"] for c in resp.get("cols", [])]
+        return [
+            {col: cell.get("value") if cell["type"] != "null" else None
+             for col, cell in zip(columns, row)}
+            for row in resp.get("rows", [])
+        ]
+
+    def _post(self, reqs):
+        """Send one pipeline request (already ending in _CLOSE_REQ) and return its results."""
+        resp = self._session.post(self.pipeline_url, data=_dumps({"requests": reqs}))
         resp.raise_for_status()
-        return self._parse_result(resp.json()["results"][0])
+        return _loads(resp.content)["results"]
+
+    def execute(self, sql, params=None):
+        results = self._post([
+            {"type": "execute", "stmt": self._make_stmt(sql, params)},
+            _CLOSE_REQ,
+        ])
+        return self._parse_result(results[0])
+
+    def query(self, sql, params=None):
+        """Run a SELECT and return its rows as a list of dicts."""
+        results = self._post([
+            {"type": "execute", "stmt": self._make_stmt(sql, params)},
+            _CLOSE_REQ,
+        ])
+        return self._parse_dict_rows(results[0])
 
     def batch(self, statements):
         reqs = [
             {"type": "execute", "stmt": self._make_stmt(sql, params)}
             for sql, params in statements
         ]
-        reqs.append({"type": "close"})
-        resp = _requests.post(
-            self.pipeline_url, json={"requests": reqs}, headers=self._headers()
-        )
-        resp.raise_for_status()
-        results = resp.json()["results"]
+        reqs.append(_CLOSE_REQ)
+        results = self._post(reqs)
         for i, r in enumerate(results):
             if r.get("type") == "error":
                 raise Exception(
@@ -108,8 +174,111 @@ class TursoClient:
                 )
         return results
 
+    def transaction(self, statements):
+        """
+        Run statements atomically as one Hrana batch request. Each statement
+        only runs if the previous step succeeded, and ROLLBACK runs unless
+        COMMIT did, so a failure leaves nothing from the batch behind.
+        (A plain pipeline of BEGIN/.../COMMIT keeps going after an error.)
+        """
+        steps = [{"stmt": self._make_stmt("BEGIN")}]
+        for sql, params in statements:
+            steps.append({
+                "stmt": self._make_stmt(sql, params),
+                "condition": {"type": "ok", "step": len(steps) - 1},
+            })
+        commit_step = len(steps)
+        steps.append({
+            "stmt": self._make_stmt("COMMIT"),
+            "condition": {"type": "ok", "step": commit_step - 1},
+        })
+        steps.append({
+            "stmt": self._make_stmt("ROLLBACK"),
+            "condition": {"type": "not", "cond": {"type": "ok", "step": commit_step}},
+        })
+        result = self._post([{"type": "batch", "batch": {"steps": steps}}, _CLOSE_REQ])[0]
+        if result["type"] == "error":
+            raise Exception(f"Turso error: {result['error']['message']}")
+        batch_result = result["response"]["result"]
+        for i, err in enumerate(batch_result["step_errors"][:commit_step + 1]):
+            if err is not None:
+                raise Exception(f"Turso transaction error at step {i}: {err['message']}")
+        return batch_result["step_results"][1:commit_step]
+
     def close(self):
-        pass
+        self._session.close()
+
+
+class BatchWriter:
+    """
+    Background writer for an async scraper: submit() queues a group of
+    statements and returns immediately; a worker task writes up to max_batch
+    groups per pipeline request (waiting at most max_delay seconds to fill a
+    batch) in a thread, so DB latency overlaps with browser work. Up to
+    max_in_flight pipeline requests run at once over the client's pool.
+    """
+
+    def __init__(self, client, max_batch=64, max_delay=0.1, max_in_flight=2):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def submit(self, statements):
+        self._queue.put_nowait(statements)
+
+    async def close(self):
+        """Write everything still queued and stop the worker."""
+        self._queue.put_nowait(None)
+        await self._task
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        in_flight = set()
+        closing = False
+        while not closing:
+            group = await self._queue.get()
+            if group is None:
+                break
+            batch = [group]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    group = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if group is None:
+                    closing = True
+                    break
+                batch.append(group)
+            await self._slots.acquire()
+            task = asyncio.create_task(self._write_in_thread(batch))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.gather(*in_flight)
+
+    async def _write_in_thread(self, batch):
+        try:
+            await asyncio.to_thread(self._write, batch)
+        finally:
+            self._slots.release()
+
+    def _write(self, batch):
+        try:
+            self.client.transaction([stmt for group in batch for stmt in group])
+        except Exception as exc:
+            # One bad group rolls back the whole batch; retry groups one by one
+            logger.warning(f"Batched write of {len(batch)} groups failed ({exc}) — retrying individually")
+            for group in batch:
+                try:
+                    self.client.transaction(group)
+                except Exception as group_exc:
+                    logger.error(f"Write failed: {group_exc}")
 
 
 # ---------------------------------------------------------------------------
@@ -160,6 +329,12 @@ _SCHEMA = [
         PRIMARY KEY (notice_id, address_id)
     )
     """,
+    """
+    CREATE TABLE IF NOT EXISTS sync_state (
+        key   TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
 ]
 
 _MIGRATIONS = [
@@ -172,19 +347,22 @@ _MIGRATIONS = [
 # Date normalisation
 # ---------------------------------------------------------------------------
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Slash dates only ever match the numeric format; everything else is a month name
+_SLASH_FORMATS = ("%m/%d/%Y",)
+_MONTH_NAME_FORMATS = ("%b %d, %Y", "%B %d, %Y")
+
+
 def normalize_date(raw_date):
     if not raw_date:
         return raw_date
-    if re.match(r"^\d{4}-\d{2}-\d{2}", raw_date):
+    if _ISO_DATE_RE.match(raw_date):
         return raw_date
-    formats = [
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%m/%d/%Y",
-    ]
-    for fmt in formats:
+    clean = raw_date.strip()
+    for fmt in _SLASH_FORMATS if "/" in clean else _MONTH_NAME_FORMATS:
         try:
-            return datetime.strptime(raw_date.strip(), fmt).strftime("%Y-%m-%dT%H:%M:%S")
+            return datetime.strptime(clean, fmt).strftime("%Y-%m-%dT%H:%M:%S")
         except ValueError:
             continue
     logger.warning(f"normalize_date: could not parse '{raw_date}' — storing as-is")
@@ -195,8 +373,23 @@ def normalize_date(raw_date):
 # Public helpers
 # ---------------------------------------------------------------------------
 
+_CLIENT = None
+
+
 def connect():
-    return TursoClient()
+    """Return the shared TursoClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = TursoClient()
+    return _CLIENT
+
+
+def reset_connection():
+    """Close and drop the shared client so the next connect() builds a fresh one."""
+    global _CLIENT
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
 
 
 def init_schema(client):
@@ -221,118 +414,180 @@ def address_fingerprint(raw_address):
     return hashlib.sha256(normalised.encode()).hexdigest()[:16]
 
 
+_UPSERT_NOTICE_SQL = """
+    INSERT INTO notices (notice_id, title, href, updated_date)
+    VALUES (:notice_id, :title, :href, :updated_date)
+    ON CONFLICT(notice_id) DO UPDATE SET
+        title        = excluded.title,
+        href         = excluded.href,
+        updated_date = excluded.updated_date
+"""
+
+# Index rows per pipeline request in upsert_notices
+UPSERT_BATCH_SIZE = 200
+
+
+def _notice_params(notice):
+    return {
+        "notice_id":    notice["notice_id"],
+        "title":        notice.get("title", ""),
+        "href":         notice.get("href", ""),
+        "updated_date": normalize_date(notice.get("updated_date", "")),
+    }
+
+
 def upsert_notice(client, notice):
-    client.execute(
-        """
-        INSERT INTO notices (notice_id, title, href, updated_date)
-        VALUES (:notice_id, :title, :href, :updated_date)
-        ON CONFLICT(notice_id) DO UPDATE SET
-            title        = excluded.title,
-            href         = excluded.href,
-            updated_date = excluded.updated_date
-        """,
-        {
-            "notice_id":    notice["notice_id"],
-            "title":        notice.get("title", ""),
-            "href":         notice.get("href", ""),
-            "updated_date": normalize_date(notice.get("updated_date", "")),
-        },
-    )
+    client.execute(_UPSERT_NOTICE_SQL, _notice_params(notice))
 
 
-def upsert_notice_detail(client, detail):
+def upsert_notices(client, notices):
+    """
+    Upsert many index rows, one pipeline request and one transaction per
+    UPSERT_BATCH_SIZE rows instead of a round trip (and commit) per row.
+    A failed chunk raises, so callers never save the index watermark past
+    rows that were not stored.
+    """
+    for start in range(0, len(notices), UPSERT_BATCH_SIZE):
+        chunk = notices[start:start + UPSERT_BATCH_SIZE]
+        client.transaction([(_UPSERT_NOTICE_SQL, _notice_params(n)) for n in chunk])
+
+
+# Detail-page statements, shared by every notice_detail_statements call
+_UPDATE_NOTICE_DETAIL_SQL = """
+    UPDATE notices SET
+        title      = COALESCE(:title, title),
+        address    = :address,
+        scraped_at = :scraped_at,
+        status     = 'new'
+    WHERE notice_id = :notice_id
+"""
+
+_UPSERT_ADDRESS_SQL = """
+    INSERT INTO addresses (raw_address, fingerprint)
+    VALUES (:addr, :fp)
+    ON CONFLICT(fingerprint) DO UPDATE SET
+        raw_address = excluded.raw_address
+"""
+
+_LINK_ADDRESS_SQL = """
+    INSERT OR IGNORE INTO notice_addresses (notice_id, address_id)
+    SELECT :nid, id FROM addresses WHERE fingerprint = :fp
+"""
+
+_UPSERT_CONTACT_SQL = """
+    INSERT INTO contacts (name, email, phone, fingerprint)
+    VALUES (:name, :email, :phone, :fp)
+    ON CONFLICT(fingerprint) DO UPDATE SET
+        name  = excluded.name,
+        email = excluded.email,
+        phone = excluded.phone
+"""
+
+_LINK_CONTACT_SQL = """
+    INSERT OR IGNORE INTO notice_contacts (notice_id, contact_id)
+    SELECT :nid, id FROM contacts WHERE fingerprint = :fp
+"""
+
+
+def notice_detail_statements(detail, scraped_at=None):
+    """
+    Statements that store one scraped detail page. Link rows resolve the
+    address/contact id with a sub-select on the fingerprint, so no statement
+    depends on a prior result and the whole list can go in one batch.
+    Pass scraped_at to stamp a whole scrape pass with one timestamp.
+    """
+    nid = detail["notice_id"]
     raw_address = "\n".join(detail.get("address", []))
-    client.execute(
-        """
-        UPDATE notices SET
-            title      = COALESCE(:title, title),
-            address    = :address,
-            scraped_at = :scraped_at,
-            status     = 'new'
-        WHERE notice_id = :notice_id
-        """,
+    stmts = [(
+        _UPDATE_NOTICE_DETAIL_SQL,
         {
             "title":     detail.get("title") or None,
             "address":   raw_address,
-            "scraped_at": datetime.now().isoformat(),
-            "notice_id": detail["notice_id"],
+            "scraped_at": scraped_at or datetime.now().isoformat(),
+            "notice_id": nid,
         },
-    )
+    )]
 
     if raw_address.strip():
         fp = address_fingerprint(raw_address)
-        client.execute(
-            """
-            INSERT INTO addresses (raw_address, fingerprint)
-            VALUES (:addr, :fp)
-            ON CONFLICT(fingerprint) DO UPDATE SET
-                raw_address = excluded.raw_address
-            """,
-            {"addr": raw_address, "fp": fp},
-        )
-        rs = client.execute(
-            "SELECT id FROM addresses WHERE fingerprint = :fp", {"fp": fp}
-        )
-        if rs["rows"]:
-            client.execute(
-                """
-                INSERT OR IGNORE INTO notice_addresses (notice_id, address_id)
-                VALUES (:nid, :aid)
-                """,
-                {"nid": detail["notice_id"], "aid": int(rs["rows"][0][0])},
-            )
+        stmts.append((_UPSERT_ADDRESS_SQL, {"addr": raw_address, "fp": fp}))
+        stmts.append((_LINK_ADDRESS_SQL, {"nid": nid, "fp": fp}))
 
+    # A POC listed twice on one page only needs one upsert and one link
+    contacts = {}
     for contact in detail.get("contacts", []):
         fp = contact_fingerprint(
             contact.get("name"), contact.get("email"), contact.get("phone")
         )
-        client.execute(
-            """
-            INSERT INTO contacts (name, email, phone, fingerprint)
-            VALUES (:name, :email, :phone, :fp)
-            ON CONFLICT(fingerprint) DO UPDATE SET
-                name  = excluded.name,
-                email = excluded.email,
-                phone = excluded.phone
-            """,
+        contacts.setdefault(fp, contact)
+
+    for fp, contact in contacts.items():
+        stmts.append((
+            _UPSERT_CONTACT_SQL,
             {
                 "name":  contact.get("name"),
                 "email": contact.get("email"),
                 "phone": contact.get("phone"),
                 "fp":    fp,
             },
-        )
-        rs = client.execute(
-            "SELECT id FROM contacts WHERE fingerprint = :fp", {"fp": fp}
-        )
-        if rs["rows"]:
-            client.execute(
-                """
-                INSERT OR IGNORE INTO notice_contacts (notice_id, contact_id)
-                VALUES (:nid, :cid)
-                """,
-                {"nid": detail["notice_id"], "cid": int(rs["rows"][0][0])},
-            )
+        ))
+        stmts.append((_LINK_CONTACT_SQL, {"nid": nid, "fp": fp}))
+
+    return stmts
+
+
+def upsert_notice_detail(client, detail, scraped_at=None):
+    """Store one detail page (notice, address, contacts, links) in a single transactional batch."""
+    client.transaction(notice_detail_statements(detail, scraped_at))
 
 
 def get_stale_notices(client):
-    rs = client.execute(
+    return client.query(
         """
         SELECT notice_id, title, href, updated_date
         FROM notices
         WHERE scraped_at IS NULL OR scraped_at < updated_date
         """
     )
-    return [dict(zip(rs["columns"], row)) for row in rs["rows"]]
+
+
+def get_latest_updated_date(client):
+    """Newest ISO updated_date stored from the index, or None if there is none."""
+    # Unparseable dates are stored as-is and would sort above every ISO date
+    rs = client.execute(
+        "SELECT MAX(updated_date) FROM notices WHERE updated_date GLOB '[0-9][0-9][0-9][0-9]-*'"
+    )
+    return rs["rows"][0][0] if rs["rows"] else None
+
+
+def save_index_watermark(client):
+    """
+    Record the newest stored updated_date as the point the next index scrape
+    may stop at. Call only once every scraped index row has been upserted.
+    """
+    latest = get_latest_updated_date(client)
+    if latest:
+        client.execute(
+            """
+            INSERT INTO sync_state (key, value) VALUES ('index_watermark', :value)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            {"value": latest},
+        )
+
+
+def get_index_watermark(client):
+    """updated_date recorded by the last fully stored index scrape, or None."""
+    rows = client.query("SELECT value FROM sync_state WHERE key = 'index_watermark'")
+    return rows[0]["value"] if rows else None
 
 
 def get_all_notices(client):
-    rs = client.execute("SELECT * FROM notices")
-    return [dict(zip(rs["columns"], row)) for row in rs["rows"]]
+    return client.query("SELECT * FROM notices")
 
 
 def get_contacts_for_notice(client, notice_id):
-    rs = client.execute(
+    return client.query(
         """
         SELECT c.id, c.name, c.email, c.phone
         FROM contacts c
@@ -341,11 +596,30 @@ def get_contacts_for_notice(client, notice_id):
         """,
         {"nid": notice_id},
     )
-    return [dict(zip(rs["columns"], row)) for row in rs["rows"]]
+
+
+def get_contacts_for_notices(client, notice_ids):
+    """Contacts for many notices in one query: {notice_id: [contact, ...]}."""
+    contacts = {nid: [] for nid in notice_ids}
+    if not contacts:
+        return contacts
+    params = {f"n{i}": nid for i, nid in enumerate(contacts)}
+    rows = client.query(
+        f"""
+        SELECT nc.notice_id, c.id, c.name, c.email, c.phone
+        FROM contacts c
+        JOIN notice_contacts nc ON c.id = nc.contact_id
+        WHERE nc.notice_id IN ({", ".join(":" + k for k in params)})
+        """,
+        params,
+    )
+    for row in rows:
+        contacts[row.pop("notice_id")].append(row)
+    return contacts
 
 
 def get_notices_for_contact(client, contact_id):
-    rs = client.execute(
+    return client.query(
         """
         SELECT n.*
         FROM notices n
@@ -353,5 +627,4 @@ def get_notices_for_contact(client, contact_id):
         WHERE nc.contact_id = :cid
         """,
         {"cid": contact_id},
-    )
-    return [dict(zip(rs["columns"], row)) for row in rs["rows"]]
\ No newline at end of file
+    )
\ No newline at end of file
@@ -2,35 +2,48 @@
 SAM.gov Detail Page Scraper module.
 
 Provides scrape_details(urls) which launches one browser session,
-visits each URL, and returns a list of structured result dicts.
+visits the URLs across a few tabs, and returns a list of structured result dicts.
 """
 
+import asyncio
+import json
 import logging
 
 import nodriver as uc
 
-logger = logging.getLogger(__name__)
-
+from sam_contracts.sam_link_scraper import block_heavy_resources, wait_until
 
-async def get_text(page, selector):
-    """Return the trimmed text of the first element matching selector, or None."""
-    try:
-        elem = await page.select(selector, timeout=10)
-        if elem:
-            return (elem.text or "").strip()
-    except Exception:
-        return None
+logger = logging.getLogger(__name__)
 
+# Detail pages loaded at once (one tab each); raise until SAM.gov starts throttling
+DETAIL_CONCURRENCY = 4
+
+
+# Every field on the detail page, pulled in one evaluate instead of a CDP round-trip per element
+EXTRACT_JS = """
+(() => {
+    const text = (sel) => {
+        const el = document.querySelector(sel);
+        return el ? el.innerText.trim() : null;
+    };
+    const texts = (sel) => Array.from(document.querySelectorAll(sel), (el) => el.innerText.trim());
+    return JSON.stringify({
+        title: text('h1[aria-role="heading"]'),
+        notice_id: text('h5[aria-describedby="notice-id"]'),
+        names: texts('.contact-title-2'),
+        emails: texts('h6[aria-describedby="email"]'),
+        phones: texts('h6[aria-describedby="phone"]'),
+        address: texts('div:has(h2)>div>h6'),
+    });
+})()
+"""
 
-async def get_all_texts(page, selector):
-    """Return a list of trimmed text from all elements matching selector."""
-    try:
-        elements = await page.select_all(selector, timeout=10)
-        if elements:
-            return [(e.text or "").strip() for e in elements]
-    except Exception:
-        pass
-    return []
+# SAM.gov renders client-side; wait for the header and the contact/address blocks
+READY_JS = (
+    "!!document.querySelector('h1[aria-role=\"heading\"]')"
+    " && !!document.querySelector('div:has(h2)>div>h6')"
+)
+READY_TIMEOUT = 10
 
 
 async def _scrape_page(page, url):
@@ -38,14 +51,16 @@ async def _scrape_page(page, url):
     logger.info(f"Navigating to {url}")
     await page.get(url)
 
-    title = await get_text(page, 'h1[aria-role="heading"]')
-    notice_id = await get_text(page, 'h5[aria-describedby="notice-id"]')
+    if not await wait_until(page, READY_JS, READY_TIMEOUT):
+        logger.warning(f"  Page not fully rendered after {READY_TIMEOUT}s, extracting what is there")
+    fields = json.loads(await page.evaluate(EXTRACT_JS))
 
-    poc_names = await get_all_texts(page, ".contact-title-2")
-    poc_emails = await get_all_texts(page, 'h6[aria-describedby="email"]')
-    poc_phones = await get_all_texts(page, 'h6[aria-describedby="phone"]')
-
-    address_lines = await get_all_texts(page, "div:has(h2)>div>h6")
+    title = fields["title"]
+    notice_id = fields["notice_id"]
+    poc_names = fields["names"]
+    poc_emails = fields["emails"]
+    poc_phones = fields["phones"]
+    address_lines = fields["address"]
 
     max_pocs = max(len(poc_names), len(poc_emails), len(poc_phones), 0)
     contacts = []
@@ -72,25 +87,60 @@ async def _scrape_page(page, url):
     return result
 
 
-async def scrape_details(urls, headless=False, browser_args=None):
+async def scrape_details(urls, headless=False, browser_args=None, user_data_dir=None, on_result=None,
+                         browser=None):
     """
     Scrape a list of SAM.gov detail page URLs.
 
-    Launches one browser session, visits each URL in sequence,
-    and returns a list of result dicts.
+    Launches one browser session, visits the URLs across DETAIL_CONCURRENCY
+    tabs, and returns a list of result dicts in input order. Pass
+    user_data_dir to reuse a persistent (warm) Chrome profile. If given,
+    on_result(index, result) is called as each page finishes so callers can
+    hand results off early. Pass an already-running browser to skip
+    launching one (it is left running).
     """
-    browser = await uc.start(headless=headless, browser_args=browser_args or [], no_sandbox=True)
-    page = await browser.get("about:blank")
-
-    results = []
-    for i, url in enumerate(urls, 1):
-        logger.info(f"--- Detail {i}/{len(urls)} ---")
-        try:
-            result = await _scrape_page(page, url)
-            results.append(result)
-        except Exception as exc:
-            logger.error(f"  Failed to scrape {url}: {exc}")
-            results.append({"url": url, "error": str(exc)})
-
-    browser.stop()
-    return results
\ No newline at end of file
+    owns_browser = browser is None
+    if owns_browser:
+        browser = await uc.start(
+            headless=headless,
+            browser_args=browser_args or [],
+            no_sandbox=True,
+            user_data_dir=user_data_dir,
+        )
+
+    results = [None] * len(urls)
+    todo = asyncio.Queue()
+    for item in enumerate(urls):
+        todo.put_nowait(item)
+
+    async def worker(page):
+        while True:
+            try:
+                i, url = todo.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            logger.info(f"--- Detail {i + 1}/{len(urls)} ---")
+            try:
+                result = await _scrape_page(page, url)
+            except Exception as exc:
+                logger.error(f"  Failed to scrape {url}: {exc}")
+                result = {"url": url, "error": str(exc)}
+            results[i] = result
+            if on_result:
+                on_result(i, result)
+
+    pages = []
+    try:
+        pages.append(await browser.get("about:blank"))
+        for _ in range(min(DETAIL_CONCURRENCY, len(urls)) - 1):
+            pages.append(await browser.get("about:blank", new_tab=True))
+        for page in pages:
+            await block_heavy_resources(page)
+        await asyncio.gather(*(worker(page) for page in pages))
+    finally:
+        if owns_browser:
+            browser.stop()
+        else:
+            for page in pages[1:]:
+                await page.close()
+    return results
@@ -2,8 +2,8 @@
 SAM.gov Contract Opportunities Scraper using nodriver.
 
 Navigates to a SAM.gov search results page, waits for dynamic content to load
-using a stabilization-check loop, extracts row data (link, notice ID, updated
-date) from each result, and paginates through every page.
+using a MutationObserver quiet-period check, extracts row data (link, notice ID, updated
+date) from each result, then loads the remaining pages by URL in parallel tabs.
 
 Requirements:
     pip install nodriver
@@ -13,6 +13,7 @@ Usage:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -29,52 +30,122 @@ logger = logging.getLogger(__name__)
 START_URL = ("https://sam.gov/search/?page=1&pageSize=25&sort=-modifiedDate&sfm%5BsimpleSearch%5D%5BkeywordRadio%5D=ANY&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B0%5D%5Bkey%5D=%22C-UAS%22&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B0%5D%5Bvalue%5D=%22C-UAS%22&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B1%5D%5Bkey%5D=drone&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B1%5D%5Bvalue%5D=drone&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B2%5D%5Bkey%5D=suas&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B2%5D%5Bvalue%5D=suas&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B3%5D%5Bkey%5D=fpv&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B3%5D%5Bvalue%5D=fpv&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B4%5D%5Bkey%5D=uas&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B4%5D%5Bvalue%5D=uas&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B5%5D%5Bkey%5D=uav&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B5%5D%5Bvalue%5D=uav&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B6%5D%5Bkey%5D=ugv&sfm%5BsimpleSearch%5D%5BkeywordTags%5D%5B6%5D%5Bvalue%5D=ugv&sfm%5Bstatus%5D%5Bis_active%5D=true")
 
 # --- Configuration ---
-STABLE_ITERATIONS = 5       # Number of consecutive stable checks before considering page loaded
-STABLE_CHECK_DELAY = 0.5    # Seconds between each stability check
-INITIAL_LOAD_WAIT = 3       # Seconds to wait after initial page load / next-page click
-MAX_WAIT_CYCLES = 60        # Safety cap: max stability checks before giving up
+SETTLE_QUIET_MS = 400       # Rows count as loaded once the DOM has been quiet this long
+ROW_WAIT_TIMEOUT = 30       # Safety cap: seconds to wait for rows before giving up
+INDEX_CONCURRENCY = 4       # Results pages loaded at once (one tab each)
+NEXT_PAGE_TIMEOUT = 15      # Seconds to wait for results to change after clicking next
+
+# href of the first result row, used to notice when a next-page click has landed
+FIRST_ROW_HREF_JS = "(document.querySelector('app-opportunity-result h3 > a') || {}).href || null"
+
+
+# Resources the scrapers never read: images, fonts, media, and trackers.
+# Stylesheets stay on because innerText depends on layout (hidden text).
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+]
+
+
+async def block_heavy_resources(tab):
+    """Tell Chrome not to fetch BLOCKED_URL_PATTERNS for this tab."""
+    # Built outside the try so a wrong CDP helper name fails loudly
+    # (nodriver's generated name for Network.setBlockedURLs is set_blocked_ur_ls)
+    block_command = uc.cdp.network.set_blocked_ur_ls(urls=BLOCKED_URL_PATTERNS)
+    try:
+        await tab.send(uc.cdp.network.enable())
+        await tab.send(block_command)
+    except Exception as exc:
+        logger.warning(f"Could not enable resource blocking: {exc}")
+
+
+# Resolves with the row count once no DOM mutations have fired for quiet_ms
+# (and at least one row exists), or with whatever is there at deadline_ms.
+ROWS_SETTLED_JS = """
+new Promise((resolve) => {
+    const count = () => document.querySelectorAll(%s).length;
+    let timer = null;
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearTimeout(deadline);
+        resolve(count());
+    };
+    const settle = () => {
+        clearTimeout(timer);
+        timer = setTimeout(() => { if (count() > 0) finish(); }, %d);
+    };
+    const observer = new MutationObserver(settle);
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    const deadline = setTimeout(finish, %d);
+    settle();
+})
+"""
+
+
+async def wait_until(page, expression, timeout, poll_interval=0.1):
+    """Poll a boolean in-page expression; returns True once it holds, False on timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            if await page.evaluate(expression):
+                return True
+        except Exception:
+            pass
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(poll_interval)
 
 
 async def wait_for_rows_stable(page, selector="app-opportunity-result"):
     """
-    Wait until the number of elements matching *selector* stops changing.
+    Wait until the elements matching *selector* exist and stop changing.
+    This also covers the SPA bootstrap after a fresh navigation.
 
-    Counts the elements in a loop with a short delay.  Once the count is the
-    same for STABLE_ITERATIONS consecutive checks the page is considered fully
-    loaded and we return the count.
+    A MutationObserver in the page resolves once the DOM has been quiet for
+    SETTLE_QUIET_MS with at least one row present, so we return as soon as
+    rendering finishes instead of sleeping through fixed stability checks.
+    Gives up after ROW_WAIT_TIMEOUT seconds.
     """
-    stable_count = 0
-    previous_count = -1
+    script = ROWS_SETTLED_JS % (json.dumps(selector), SETTLE_QUIET_MS, ROW_WAIT_TIMEOUT * 1000)
+    try:
+        count = await asyncio.wait_for(
+            page.evaluate(script, await_promise=True), ROW_WAIT_TIMEOUT + 5
+        )
+        count = int(count or 0)
+    except Exception as exc:
+        logger.warning(f"  Row wait failed: {exc}")
+        count = 0
 
-    for cycle in range(MAX_WAIT_CYCLES):
-        try:
-            elements = await page.query_selector_all(selector)
-            current_count = len(elements) if elements else 0
-        except Exception:
-            current_count = 0
-
-        if current_count == previous_count and current_count > 0:
-            stable_count += 1
-            if stable_count >= STABLE_ITERATIONS:
-                logger.info(
-                    f"  Page stabilised with {current_count} rows "
-                    f"(stable for {STABLE_ITERATIONS} checks)"
-                )
-                return current_count
-        else:
-            stable_count = 0
+    if count:
+        logger.info(f"  Page stabilised with {count} rows")
+    else:
+        logger.warning(f"  No rows after {ROW_WAIT_TIMEOUT}s.")
+    return count
 
-        previous_count = current_count
-        await page.sleep(STABLE_CHECK_DELAY)
 
-    # If we exhaust cycles, return whatever we have
-    logger.warning(
-        f"  Stability cap reached after {MAX_WAIT_CYCLES} cycles. "
-        f"Proceeding with {previous_count} links."
+# "Jan 15, 2025" is what SAM.gov shows; parse it without strptime
+_MON_DAY_YEAR_RE = re.compile(r"([A-Z][a-z]{2}) (\d{1,2}), (\d{4})$")
+_MONTHS = {
+    name: i for i, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
     )
-    return previous_count
+}
+
+_DATE_FORMATS = [
+    "%b %d, %Y",   # Jan 15, 2025
+    "%B %d, %Y",   # January 15, 2025
+    "%m/%d/%Y",    # 01/15/2025
+    "%Y-%m-%d",    # 2025-01-15
+]
+
+PAGINATION_RE = re.compile(r"Page\s+(\d+)\s+of\s+(\d+)", re.IGNORECASE)
 
 
+# Sorted-by-date results repeat the same few dates on every row
+@functools.lru_cache(maxsize=4096)
 def normalize_date(raw_date):
     """
     Convert a human-readable date string from SAM.gov into ISO 8601 format
@@ -89,52 +160,58 @@ def normalize_date(raw_date):
     if not raw_date:
         return raw_date
 
-    formats = [
-        "%b %d, %Y",   # Jan 15, 2025
-        "%B %d, %Y",   # January 15, 2025
-        "%m/%d/%Y",    # 01/15/2025
-        "%Y-%m-%d",    # 2025-01-15
-    ]
-    for fmt in formats:
+    clean = raw_date.strip()
+    match = _MON_DAY_YEAR_RE.match(clean)
+    if match and match.group(1) in _MONTHS:
         try:
-            return datetime.strptime(raw_date.strip(), fmt).strftime("%Y-%m-%dT%H:%M:%S")
+            parsed = datetime(int(match.group(3)), _MONTHS[match.group(1)], int(match.group(2)))
+            return parsed.strftime("%Y-%m-%dT%H:%M:%S")
+        except ValueError:
+            pass
+
+    for i, fmt in enumerate(_DATE_FORMATS):
+        try:
+            parsed = datetime.strptime(clean, fmt)
         except ValueError:
             continue
+        if i:
+            # The format is stable within a run; try the winner first next time
+            _DATE_FORMATS.insert(0, _DATE_FORMATS.pop(i))
+        return parsed.strftime("%Y-%m-%dT%H:%M:%S")
 
     logger.warning(f"Could not parse date '{raw_date}' – storing as-is")
     return raw_date
 
 
+# Every result row's fields in one evaluate instead of ~4 CDP round-trips per row;
+# hrefs come back absolute
+EXTRACT_ROWS_JS = """
+(() => {
+    const text = (row, sel) => {
+        const el = row.querySelector(sel);
+        return el ? el.innerText.trim() : "";
+    };
+    return JSON.stringify(Array.from(document.querySelectorAll("app-opportunity-result"), (row) => {
+        const link = row.querySelector("h3 > a");
+        return {
+            title: link ? link.innerText.trim() : "",
+            href: link && link.getAttribute("href") ? new URL(link.getAttribute("href"), "https://sam.gov").href : "",
+            notice_id: text(row, "div.margin-y-1 > h3"),
+            updated_date: text(row, ".grid-col-auto > div:nth-of-type(3) .sds-field__value"),
+        };
+    }));
+})()
+"""
+
+
 async def extract_rows(page):
     """Extract link, ID, and updated date from each app-opportunity-result row."""
-    rows = await page.query_selector_all("app-opportunity-result")
-    results = []
+    rows = json.loads(await page.evaluate(EXTRACT_ROWS_JS))
     for row in rows:
-        # Link
-        link_elem = await row.query_selector("h3 > a")
-        title = (link_elem.text or "").strip() if link_elem else ""
-        href = ""
-        if link_elem and link_elem.attrs:
-            href = link_elem.attrs.get("href", "")
-            if href and not href.startswith("http"):
-                href = f"https://sam.gov{href}"
-
-        # Notice ID
-        id_elem = await row.query_selector("div.margin-y-1 > h3")
-        notice_id = (id_elem.text or "").strip().removeprefix("Notice ID: ") if id_elem else ""
-
+        row["notice_id"] = row["notice_id"].removeprefix("Notice ID: ")
         # Updated date – normalize to ISO 8601 so DB comparisons work
-        date_elem = await row.query_selector(".grid-col-auto > div:nth-of-type(3) .sds-field__value")
-        raw_date = (date_elem.text or "").strip() if date_elem else ""
-        updated_date = normalize_date(raw_date)
-
-        results.append({
-            "title": title,
-            "href": href,
-            "notice_id": notice_id,
-            "updated_date": updated_date,
-        })
-    return results
+        row["updated_date"] = normalize_date(row["updated_date"])
+    return rows
 
 
 async def get_pagination_info(page):
@@ -151,7 +228,7 @@ async def get_pagination_info(page):
         cur_elem = await page.query_selector("#bottomPagination-currentPage")
         if cur_elem:
             label = cur_elem.attrs.get("aria-label", "")
-            match = re.search(r"Page\s+(\d+)\s+of\s+(\d+)", label, re.IGNORECASE)
+            match = PAGINATION_RE.search(label)
             if match:
                 current_page = int(match.group(1))
                 total_pages = int(match.group(2))
@@ -162,75 +239,161 @@ async def get_pagination_info(page):
 
 
 async def click_next_page(page):
-    """Click the 'Next page' button and wait for new results to start loading."""
+    """Click the 'Next page' button and wait until the first result row changes."""
     try:
         next_btn = await page.query_selector("#bottomPagination-nextPage")
         if next_btn:
+            first_href = await page.evaluate(FIRST_ROW_HREF_JS)
             await next_btn.click()
-            await page.sleep(INITIAL_LOAD_WAIT)
-            # Let the page "breathe" so the DOM can update
-            await page
+            changed = f"({FIRST_ROW_HREF_JS}) !== {json.dumps(first_href)}"
+            if not await wait_until(page, changed, NEXT_PAGE_TIMEOUT):
+                logger.warning(f"  Results did not change within {NEXT_PAGE_TIMEOUT}s of clicking next.")
             return True
     except Exception as exc:
         logger.error(f"  Error clicking next page: {exc}")
     return False
 
 
-async def scrape_index(headless=False, browser_args=None):
+def page_url(page_num):
+    """START_URL pointed at results page *page_num*."""
+    return START_URL.replace("?page=1&", f"?page={page_num}&", 1)
+
+
+async def scrape_results_page(tab, page_num):
+    """Load one results page directly by URL and return its rows."""
+    logger.info(f"--- Scraping page {page_num} ---")
+    await tab.get(page_url(page_num))
+    if await wait_for_rows_stable(tab) == 0:
+        logger.warning(f"  No rows found on page {page_num}.")
+        return []
+    rows = await extract_rows(tab)
+    logger.info(f"  Page {page_num}: extracted {len(rows)} rows")
+    return rows
+
+
+async def scrape_remaining_pages(browser, first_tab, total_pages):
     """
-    Scrape all index pages and return the list of row dicts.
+    Fetch pages 2..total_pages across up to INDEX_CONCURRENCY tabs
+    (first_tab included) and return their rows in page order.
+    """
+    page_nums = list(range(2, total_pages + 1))
+    todo = asyncio.Queue()
+    for page_num in page_nums:
+        todo.put_nowait(page_num)
+    rows_by_page = {}
+
+    async def worker(tab):
+        while True:
+            try:
+                page_num = todo.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                rows_by_page[page_num] = await scrape_results_page(tab, page_num)
+            except Exception as exc:
+                logger.error(f"  Failed to scrape page {page_num}: {exc}")
+
+    tabs = [first_tab]
+    for _ in range(min(INDEX_CONCURRENCY, len(page_nums)) - 1):
+        tab = await browser.get("about:blank", new_tab=True)
+        await block_heavy_resources(tab)
+        tabs.append(tab)
+    try:
+        await asyncio.gather(*(worker(tab) for tab in tabs))
+    finally:
+        for tab in tabs[1:]:
+            await tab.close()
+
+    return [row for page_num in page_nums for row in rows_by_page.get(page_num, [])]
+
+
+# Matches the GLOB sam_db uses to keep non-ISO dates out of the watermark
+_ISO_PREFIX_RE = re.compile(r"\d{4}-")
+
 
-    Each row has: title, href, notice_id, updated_date.
+def reaches_known_rows(rows, known_through):
     """
-    all_rows = []
+    True if *rows* include a notice updated strictly before *known_through*
+    (an ISO updated_date already stored). Results are sorted newest first,
+    so every later page is then older still and already in the database.
+    A missing or non-ISO known_through never stops the scan.
+    """
+    if not known_through or not _ISO_PREFIX_RE.match(known_through):
+        return False
+    return any(
+        row["updated_date"][:1].isdigit() and row["updated_date"] < known_through
+        for row in rows
+    )
 
-    logger.info("Launching browser …")
-    browser = await uc.start(headless=headless, browser_args=browser_args or [], no_sandbox=True)
 
-    logger.info(f"Navigating to SAM.gov search …")
-    page = await browser.get(START_URL)
+async def scrape_index(headless=False, browser_args=None, user_data_dir=None, browser=None,
+                       known_through=None):
+    """
+    Scrape all index pages and return the list of row dicts.
 
-    # Give the SPA a moment to bootstrap
-    await page.sleep(INITIAL_LOAD_WAIT)
-    await page
+    Page 1 tells us the page count; the rest are loaded by URL in parallel
+    tabs. Each row has: title, href, notice_id, updated_date.
+    Pass user_data_dir to reuse a persistent (warm) Chrome profile, or an
+    already-running browser to skip launching one (it is left running).
+    Pass known_through (the newest updated_date already stored) to stop
+    paginating once the results reach older, already-stored notices.
+    """
+    all_rows = []
 
-    page_num = 0
-    while True:
-        page_num += 1
-        logger.info(f"--- Scraping page {page_num} ---")
+    owns_browser = browser is None
+    if owns_browser:
+        logger.info("Launching browser …")
+        browser = await uc.start(
+            headless=headless,
+            browser_args=browser_args or [],
+            no_sandbox=True,
+            user_data_dir=user_data_dir,
+        )
 
-        # 1. Wait for rows to stabilise
-        row_count = await wait_for_rows_stable(page)
+    logger.info(f"Navigating to SAM.gov search …")
+    page = await browser.get("about:blank")
+    await block_heavy_resources(page)
+    await page.get(START_URL)
 
-        if row_count == 0:
+    try:
+        logger.info("--- Scraping page 1 ---")
+        if await wait_for_rows_stable(page) == 0:
             logger.warning("  No rows found on this page. Stopping.")
-            break
+            return all_rows
 
-        # 2. Extract row data
         rows = await extract_rows(page)
         logger.info(f"  Extracted {len(rows)} rows")
         all_rows.extend(rows)
 
-        # 3. Read pagination info
         current_page, total_pages = await get_pagination_info(page)
         logger.info(f"  Pagination: page {current_page} of {total_pages}")
 
-        # 4. Decide whether to continue
-        if current_page is not None and total_pages is not None:
-            if current_page >= total_pages:
-                logger.info("  Reached the last page.")
-                break
+        if reaches_known_rows(rows, known_through):
+            logger.info(f"  Page 1 reaches notices updated before {known_through}; skipping older pages.")
+        elif total_pages is not None:
+            all_rows.extend(await scrape_remaining_pages(browser, page, total_pages))
         else:
-            # Fallback: if we can't read pagination, try clicking next anyway
-            logger.warning("  Could not determine pagination — attempting next page.")
-
-        # 5. Click next
-        if not await click_next_page(page):
-            logger.info("  No next-page button found. Done.")
-            break
+            # Fallback: if we can't read pagination, click through serially
+            logger.warning("  Could not determine pagination — clicking through pages.")
+            page_num = 1
+            while await click_next_page(page):
+                page_num += 1
+                logger.info(f"--- Scraping page {page_num} ---")
+                if await wait_for_rows_stable(page) == 0:
+                    break
+                rows = await extract_rows(page)
+                logger.info(f"  Extracted {len(rows)} rows")
+                all_rows.extend(rows)
+                if reaches_known_rows(rows, known_through):
+                    break
+                current_page, total_pages = await get_pagination_info(page)
+                if current_page is not None and total_pages is not None and current_page >= total_pages:
+                    break
+    finally:
+        if owns_browser:
+            browser.stop()
 
     logger.info(f"Done! Scraped {len(all_rows)} rows")
-    browser.stop()
     return all_rows
 
 